@@ -29,6 +29,9 @@ Usage:
     ccs help                               Show help
 """
 
+import bisect
+import concurrent.futures
+import functools
 import json
 import os
 import glob
@@ -39,6 +42,7 @@ import subprocess
 import sys
 import shlex
 import shutil
+import sqlite3
 import time
 import uuid as uuid_mod
 from dataclasses import dataclass, field
@@ -65,6 +69,25 @@ except ImportError as e:
 
 VERSION = "1.3.0"
 
+# Optional fast JSON: orjson decodes session transcripts several times
+# faster than the stdlib. Fall back silently when it isn't installed.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_loads(s):
+    if _orjson is not None:
+        return _orjson.loads(s)
+    return json.loads(s)
+
+
+def _json_dumps(data) -> str:
+    if _orjson is not None:
+        return _orjson.dumps(data, option=_orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
 # ── Paths ─────────────────────────────────────────────────────────────
 
 CLAUDE_DIR = Path.home() / ".claude"
@@ -74,9 +97,27 @@ META_FILE = CCS_DIR / "sessions.json"
 PROFILES_FILE = CCS_DIR / "ccs_profiles.json"
 ACTIVE_PROFILE_FILE = CCS_DIR / "ccs_active_profile.txt"
 THEME_FILE = CCS_DIR / "ccs_theme.txt"
-CACHE_FILE = CCS_DIR / "session_cache.json"
+CACHE_FILE = CCS_DIR / "session_cache.json"  # legacy, migrated to CACHE_DB
+CACHE_DB = CCS_DIR / "session_cache.db"
+GIT_CACHE_FILE = CCS_DIR / "git_cache.json"
 HAS_TMUX = shutil.which("tmux") is not None
+# Opt-in: CCS_FAST_SCAN=1 stops parsing huge transcripts once the display
+# fields are known, extrapolating the message count from bytes seen.
+FAST_SCAN = os.environ.get("CCS_FAST_SCAN", "") == "1"
+FAST_SCAN_BUDGET = 256 * 1024  # bytes parsed per file before bailing
 HAS_GIT = shutil.which("git") is not None
+# ANSI colors for CLI output; a single NO_COLOR check at import blanks
+# them all (https://no-color.org)
+_NO_COLOR = bool(os.environ.get("NO_COLOR"))
+RED = "" if _NO_COLOR else "\033[31m"
+YELLOW = "" if _NO_COLOR else "\033[33m"
+DIM = "" if _NO_COLOR else "\033[2m"
+BOLD = "" if _NO_COLOR else "\033[1m"
+CYAN = "" if _NO_COLOR else "\033[1;36m"
+BOLD_RED = "" if _NO_COLOR else "\033[1;31m"
+BOLD_GREEN = "" if _NO_COLOR else "\033[1;32m"
+BOLD_YELLOW = "" if _NO_COLOR else "\033[1;33m"
+RESET = "" if _NO_COLOR else "\033[0m"
 TMUX_PREFIX = "ccs-"
 TMUX_IDLE_SECS = 30   # seconds of no output before marking session idle
 TMUX_POLL_INTERVAL = 5  # seconds between activity polls
@@ -115,6 +156,15 @@ TOGGLE_FLAGS = [
     ("--no-session-persistence",         "--no-session-persistence"),
 ]
 
+# Reverse id → index maps so profile loads don't linear-scan the lists
+MODEL_IDX = {mid: i for i, (_, mid) in enumerate(MODELS)}
+PERM_IDX = {pid: i for i, (_, pid) in enumerate(PERMISSION_MODES)}
+
+# Display strings used by the profile editor repaint loop, built once
+MODEL_LABELS = tuple(name for name, _ in MODELS)
+PERM_LABELS = tuple(name for name, _ in PERMISSION_MODES)
+_TOGGLE_PREFIXES = tuple(f"{name:<38s} " for name, _ in TOGGLE_FLAGS)
+
 # Row types in profile editor
 ROW_MODEL = "model"
 ROW_PERMMODE = "permmode"
@@ -131,7 +181,7 @@ ROW_PROF_SAVE = "prof_save"
 # ── Data ──────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     id: str
     project_raw: str
@@ -151,40 +201,96 @@ class Session:
     continuation_count: int = 0
     hide_when_collapsed: bool = False
     chain_root: str = ""  # root ancestor ID for grouping
+    search_blob: str = field(default="", repr=False, compare=False)
+    tag_disp: str = field(default="", repr=False, compare=False)
+    msg_disp: str = field(default="", repr=False, compare=False)
+    _sort_label: str = field(default="", repr=False, compare=False)
+    _sort_proj: str = field(default="", repr=False, compare=False)
+    _sort_tag: str = field(default="", repr=False, compare=False)
+    _ts_cache: str = field(default="", repr=False, compare=False)
+    _age_cache: str = field(default="", repr=False, compare=False)
+    _age_cache_min: int = field(default=-1, repr=False, compare=False)
 
     @property
     def ts(self) -> str:
-        return datetime.datetime.fromtimestamp(self.mtime).strftime("%Y-%m-%d %H:%M")
+        if not self._ts_cache:
+            self._ts_cache = datetime.datetime.fromtimestamp(self.mtime).strftime("%Y-%m-%d %H:%M")
+        return self._ts_cache
 
     @property
     def age(self) -> str:
-        delta = datetime.datetime.now() - datetime.datetime.fromtimestamp(self.mtime)
-        if delta.days > 365:
-            return f"{delta.days // 365}y ago"
-        if delta.days > 30:
-            return f"{delta.days // 30}mo ago"
-        if delta.days > 0:
-            return f"{delta.days}d ago"
-        hours = delta.seconds // 3600
-        if hours > 0:
-            return f"{hours}h ago"
-        mins = delta.seconds // 60
-        return f"{mins}m ago" if mins > 0 else "just now"
+        # Age only has minute resolution, so cache the rendered string per
+        # minute — list rebuilds hit this for every visible row.
+        now_min = int(time.time()) // 60
+        if now_min == self._age_cache_min:
+            return self._age_cache
+        secs = max(0, now_min * 60 - int(self.mtime))
+        days = secs // 86400
+        if days > 365:
+            out = f"{days // 365}y ago"
+        elif days > 30:
+            out = f"{days // 30}mo ago"
+        elif days > 0:
+            out = f"{days}d ago"
+        else:
+            hours = secs // 3600
+            if hours > 0:
+                out = f"{hours}h ago"
+            else:
+                mins = secs // 60
+                out = f"{mins}m ago" if mins > 0 else "just now"
+        self._age_cache = out
+        self._age_cache_min = now_min
+        return out
 
     @property
     def label(self) -> str:
         return self.summary or self.last_msg or self.first_msg or "(empty session)"
 
+    def build_search_blob(self) -> None:
+        """Precompute the lowercased text searched by the filter.
+
+        Newline-joined so a query can't match across field boundaries.
+        Must be rebuilt if the tag changes after construction. The
+        lowercased pieces double as the sort keys used by get_sort_key.
+        """
+        self._sort_tag = (self.tag or "").lower()
+        self._sort_label = (self.label or "").lower()
+        self._sort_proj = self.project_display.lower()
+        if not self.tag:
+            self.tag_disp = ""
+        elif len(self.tag) > 8:
+            self.tag_disp = f"[{self.tag[:8]}...]"
+        else:
+            self.tag_disp = f"[{self.tag}]"
+        n = self.msg_count
+        if n >= 10000:
+            self.msg_disp = f"{n // 1000:>3d}k  "
+        elif n >= 1000:
+            self.msg_disp = f"{n // 1000}.{(n % 1000) // 100}k  "
+        elif n:
+            self.msg_disp = f"{n:>3d}m  "
+        else:
+            self.msg_disp = "      "
+        self.search_blob = "\n".join((
+            self._sort_tag,
+            self._sort_label,
+            self._sort_proj,
+            self.id.lower(),
+        ))
+
     def get_sort_key(self, sort_mode: str = "date") -> Tuple:
+        if not self._sort_label:
+            self.build_search_blob()
         tier = 0 if self.pinned else 1
         if sort_mode == "name":
-            return (tier, self.label.lower(), -self.mtime)
+            return (tier, self._sort_label, -self.mtime)
         elif sort_mode == "project":
-            return (tier, self.project_display.lower(), -self.mtime)
+            return (tier, self._sort_proj, -self.mtime)
         elif sort_mode == "messages":
             return (tier, -self.msg_count, -self.mtime)
         elif sort_mode == "tag":
-            return (tier, 0 if self.tag else 1, (self.tag or "").lower(), -self.mtime)
+            return (tier, 0 if self.tag else 1, self._sort_tag, -self.mtime)
         return (tier, -self.mtime)
 
 
@@ -192,16 +298,31 @@ class Session:
 
 
 class SessionManager:
+    _ensured = False  # class-level: dirs/migration checked once per process
+
     def __init__(self):
         self.user = getpass.getuser()
         self._scan_cache = None
+        self._file_cache: dict = {}  # path -> (mtime_ns, parsed data)
+        self._cache_db = None  # lazy sqlite connection for the scan cache
+        self._active_prof_cache = None  # (mtime_ns, name)
+        self._profiles_src = None  # raw _load result backing _profiles_cache
+        self._profiles_cache: List[dict] = []
+        self._profiles_by_name: dict = {}
+        # Lookup indexes rebuilt by scan(): exact tag → sessions, and a
+        # sorted id list for bisect-based prefix resolution
+        self._by_tag: dict = {}
+        self._ids_sorted: List[Tuple[str, "Session"]] = []
         self._ensure()
 
     def _ensure(self):
+        if SessionManager._ensured:
+            return
         CCS_DIR.mkdir(parents=True, exist_ok=True)
         self._migrate_old_meta()
         if not META_FILE.exists():
             META_FILE.write_text("{}")
+        SessionManager._ensured = True
 
     def _migrate_old_meta(self):
         """One-time migration from old multi-file metadata to sessions.json."""
@@ -244,15 +365,37 @@ class SessionManager:
                 pass
 
     def _load(self, p, default):
+        """Load a JSON file, reusing the parsed result while its mtime
+        is unchanged. Metadata and profile files are re-read many times
+        per refresh; this keeps those reads out of the hot path while
+        still noticing edits made by other ccs processes."""
+        key = str(p)
+        try:
+            mt = os.stat(p).st_mtime_ns
+        except OSError:
+            return default
+        hit = self._file_cache.get(key)
+        if hit is not None and hit[0] == mt:
+            return hit[1]
         try:
             with open(p) as f:
-                return json.load(f)
+                data = _json_loads(f.read())
         except Exception:
             return default
+        self._file_cache[key] = (mt, data)
+        return data
 
     def _save(self, p, data):
-        with open(p, "w") as f:
-            json.dump(data, f, indent=2)
+        # Write-then-rename so a crash mid-write can never leave a
+        # truncated JSON file behind for the next run to choke on.
+        tmp = str(p) + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(_json_dumps(data))
+        os.replace(tmp, p)
+        try:
+            self._file_cache[str(p)] = (os.stat(p).st_mtime_ns, data)
+        except OSError:
+            self._file_cache.pop(str(p), None)
 
     def _load_meta(self) -> dict:
         return self._load(META_FILE, {})
@@ -295,7 +438,7 @@ class SessionManager:
         for idx_path in glob.glob(str(PROJECTS_DIR / "*" / "sessions-index.json")):
             try:
                 with open(idx_path) as f:
-                    data = json.load(f)
+                    data = _json_loads(f.read())
                 orig = data.get("originalPath", "")
                 for entry in data.get("entries", []):
                     sid = entry.get("sessionId", "")
@@ -321,8 +464,14 @@ class SessionManager:
         return result
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _decode_proj_fallback(raw: str, user: str) -> str:
-        """Fallback project display when sessions-index.json is unavailable."""
+        """Fallback project display when sessions-index.json is unavailable.
+
+        Memoized: every session in a project shares the same encoded dir
+        name, and resolving one walks the filesystem via
+        _resolve_dashed_path, so repeat decodes are pure dict hits.
+        """
         p = raw
         pfx = "-Users-" + user
         if p.startswith(pfx):
@@ -374,6 +523,220 @@ class SessionManager:
                 return c
         return ""
 
+    # ── Scan cache persistence (SQLite) ─────────────────────────────
+
+    _CACHE_COLS = (
+        "id", "mtime", "size", "summary", "first_msg", "first_msg_long",
+        "last_msg", "msg_count", "summaries", "project_raw",
+        "project_display", "is_continuation", "parent_id",
+    )
+
+    def _cache_conn(self):
+        """Open (once) the SQLite scan cache, creating/migrating as needed.
+
+        SQLite gives per-row upserts and deletes, so a scan that touched
+        three sessions writes three rows instead of re-serializing the
+        whole cache file the way the old JSON blob did."""
+        if self._cache_db is None:
+            conn = sqlite3.connect(CACHE_DB)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "id TEXT PRIMARY KEY, mtime REAL, size INTEGER,"
+                "summary TEXT, first_msg TEXT, first_msg_long TEXT,"
+                "last_msg TEXT, msg_count INTEGER, summaries TEXT,"
+                "project_raw TEXT, project_display TEXT,"
+                "is_continuation INTEGER, parent_id TEXT)"
+            )
+            conn.commit()
+            self._cache_db = conn
+            self._migrate_json_cache(conn)
+        return self._cache_db
+
+    def _migrate_json_cache(self, conn):
+        """One-time import of the legacy session_cache.json blob."""
+        if not CACHE_FILE.exists():
+            return
+        data = self._load(CACHE_FILE, {})
+        if isinstance(data, dict) and data:
+            self._write_cache_rows(conn, data, data.keys())
+            conn.commit()
+        try:
+            CACHE_FILE.unlink()
+        except OSError:
+            pass
+
+    def _write_cache_rows(self, conn, cache: dict, sids):
+        rows = []
+        for sid in sids:
+            e = cache.get(sid)
+            if e is None:
+                continue
+            rows.append((
+                sid, e.get("mtime", 0), e.get("size", 0),
+                e.get("summary", ""), e.get("first_msg", ""),
+                e.get("first_msg_long", ""), e.get("last_msg", ""),
+                e.get("msg_count", 0), json.dumps(e.get("summaries", [])),
+                e.get("project_raw", ""), e.get("project_display", ""),
+                1 if e.get("is_continuation") else 0, e.get("parent_id", ""),
+            ))
+        if rows:
+            conn.executemany(
+                "INSERT OR REPLACE INTO sessions VALUES "
+                "(?,?,?,?,?,?,?,?,?,?,?,?,?)",
+                rows,
+            )
+
+    def _load_cache_db(self) -> dict:
+        try:
+            conn = self._cache_conn()
+            cache = {}
+            for row in conn.execute(
+                "SELECT %s FROM sessions" % ",".join(self._CACHE_COLS)
+            ):
+                cache[row[0]] = {
+                    "mtime": row[1],
+                    "size": row[2],
+                    "summary": row[3],
+                    "first_msg": row[4],
+                    "first_msg_long": row[5],
+                    "last_msg": row[6],
+                    "msg_count": row[7],
+                    "summaries": _json_loads(row[8]) if row[8] else [],
+                    "project_raw": row[9],
+                    "project_display": row[10],
+                    "is_continuation": bool(row[11]),
+                    "parent_id": row[12],
+                }
+            return cache
+        except Exception:
+            return {}
+
+    def _save_cache_db(self, cache: dict, dirty_sids, removed_sids, full: bool = False):
+        """Flush cache changes: upsert dirty rows, delete removed ones.
+
+        With full=True the table is rebuilt from *cache* wholesale (used
+        by forced rescans, which bypassed the stored rows entirely)."""
+        if not full and not dirty_sids and not removed_sids:
+            return
+        try:
+            conn = self._cache_conn()
+            if full:
+                conn.execute("DELETE FROM sessions")
+                self._write_cache_rows(conn, cache, cache.keys())
+            else:
+                self._write_cache_rows(conn, cache, dirty_sids)
+                if removed_sids:
+                    conn.executemany(
+                        "DELETE FROM sessions WHERE id=?",
+                        [(sid,) for sid in removed_sids],
+                    )
+            conn.commit()
+        except Exception:
+            pass
+
+    def clear_scan_cache(self):
+        """Drop all cached scan state (in memory and on disk)."""
+        self._scan_cache = None
+        try:
+            conn = self._cache_conn()
+            conn.execute("DELETE FROM sessions")
+            conn.commit()
+        except Exception:
+            pass
+        try:
+            if CACHE_FILE.exists():
+                CACHE_FILE.unlink()
+        except OSError:
+            pass
+
+    def _parse_session_file(self, jp: str, offset: int = 0) -> dict:
+        """Parse one session .jsonl file and return its derived fields.
+
+        Reads in binary and byte-probes each line before decoding: most
+        lines are tool traffic whose JSON we never inspect, so the full
+        json.loads is only paid for lines that can possibly be a summary,
+        user or assistant entry (or the first entry carrying a sessionId).
+
+        With a non-zero offset only the tail of the file is parsed, which
+        lets scan() pick up appended entries without re-reading the whole
+        transcript (appends are line-aligned).
+        """
+        summary, fm, fm_long, lm = "", "", "", ""
+        sums: List[str] = []
+        msg_count = 0
+        first_entry_sid = ""
+        has_cont_text = False
+        fast = FAST_SCAN and not offset
+        consumed = 0
+        try:
+            with open(jp, "rb") as f:
+                if offset:
+                    f.seek(offset)
+                for ln in f:
+                    if fast:
+                        consumed += len(ln)
+                        if consumed > FAST_SCAN_BUDGET and fm and first_entry_sid:
+                            # Enough for display purposes — extrapolate the
+                            # message count from the bytes parsed so far.
+                            # (Last-message display degrades to whatever was
+                            # seen inside the budget; opt-in tradeoff.)
+                            try:
+                                total = os.path.getsize(jp)
+                            except OSError:
+                                total = consumed
+                            if msg_count:
+                                msg_count = max(
+                                    msg_count,
+                                    int(msg_count * total / consumed),
+                                )
+                            break
+                    # Cheap prescreen: skip lines that cannot contain a
+                    # type we care about. False positives just fall through
+                    # to json.loads, so semantics are unchanged.
+                    if first_entry_sid or b'"sessionId"' not in ln:
+                        if (b'"summary"' not in ln and b'"user"' not in ln
+                                and b'"assistant"' not in ln):
+                            continue
+                    try:
+                        d = _json_loads(ln.decode("utf-8", errors="replace"))
+                    except Exception:
+                        continue
+                    msg_type = d.get("type")
+                    # Capture sessionId from first entry for parent linking
+                    if not first_entry_sid and d.get("sessionId"):
+                        first_entry_sid = d["sessionId"]
+                    if msg_type == "summary":
+                        s = d.get("summary", "")
+                        if s:
+                            sums.append(s)
+                            summary = s
+                    elif msg_type in ("user", "assistant"):
+                        msg_count += 1
+                        if msg_type == "user":
+                            txt = self._extract_text(d.get("message", {}))
+                            if txt:
+                                clean = txt[:120].replace("\n", " ").replace("\t", " ")
+                                if not fm:
+                                    fm = clean
+                                    fm_long = txt[:800]
+                                lm = clean
+                                if not has_cont_text and txt.startswith("This session is being continued"):
+                                    has_cont_text = True
+        except Exception:
+            pass
+        return {
+            "summary": summary,
+            "first_msg": fm,
+            "first_msg_long": fm_long,
+            "last_msg": lm,
+            "msg_count": msg_count,
+            "summaries": sums,
+            "first_entry_sid": first_entry_sid,
+            "has_cont_text": has_cont_text,
+        }
+
     def scan(self, sort_mode: str = "date", force: bool = False) -> List[Session]:
         meta = self._load_meta()
         if force:
@@ -381,27 +744,81 @@ class SessionManager:
         elif self._scan_cache is not None:
             cache = self._scan_cache
         else:
-            cache = self._load(CACHE_FILE, {})
+            cache = self._load_cache_db()
         out: List[Session] = []
         seen_sids: set = set()
-        cache_dirty = False
+        dirty_sids: set = set()
+        removed_sids: set = set()
         empty_sids: List[str] = []
         proj_paths = self._load_project_paths()
-        pattern = str(PROJECTS_DIR / "*" / "*.jsonl")
 
-        for jp in glob.glob(pattern):
-            sid = os.path.basename(jp).replace(".jsonl", "")
+        # Pass 1: walk project dirs with scandir (one readdir per project,
+        # mtime/size come from the directory entry without extra stat
+        # calls) and decide which files need parsing. offset is None for a
+        # cache hit, 0 for a full parse, >0 for an append-only tail parse
+        # picking up where the cached state left off.
+        records = []
+        jobs: dict = {}  # sid -> (path, offset)
+        file_entries = []
+        try:
+            with os.scandir(PROJECTS_DIR) as proj_it:
+                for pe in proj_it:
+                    if not pe.is_dir():
+                        continue
+                    try:
+                        with os.scandir(pe.path) as file_it:
+                            for fe in file_it:
+                                if fe.name.endswith(".jsonl"):
+                                    file_entries.append((pe.name, fe))
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        for dir_name, fe in file_entries:
+            jp = fe.path
+            sid = fe.name[:-6]
             seen_sids.add(sid)
-            praw = os.path.basename(os.path.dirname(jp))
+            praw = dir_name
             pdisp = proj_paths.get(sid) or self._decode_proj_fallback(praw, self.user)
+            try:
+                fst = fe.stat()
+            except OSError:
+                seen_sids.discard(sid)
+                continue
+            file_mtime = fst.st_mtime
+            file_size = fst.st_size
+            cached = cache.get(sid)
+            if cached and cached.get("mtime") == file_mtime:
+                offset = None
+            elif (cached and cached.get("size")
+                    and cached.get("msg_count", 0) > 0
+                    and file_size > cached["size"]):
+                offset = cached["size"]
+            else:
+                offset = 0
+            if offset is not None:
+                jobs[sid] = (jp, offset)
+            records.append((sid, jp, praw, pdisp, file_mtime, file_size, cached, offset))
+
+        # Parse cache misses in parallel — the work is dominated by file
+        # I/O so threads overlap nicely despite the GIL.
+        parsed_by_sid: dict = {}
+        if len(jobs) > 1:
+            workers = min(8, len(jobs))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+                results = ex.map(lambda a: self._parse_session_file(*a), jobs.values())
+                parsed_by_sid = dict(zip(jobs.keys(), results))
+        elif jobs:
+            sid, (jp, offset) = next(iter(jobs.items()))
+            parsed_by_sid[sid] = self._parse_session_file(jp, offset)
+
+        # Pass 2: merge parse results with cached state and build sessions.
+        for sid, jp, praw, pdisp, file_mtime, file_size, cached, offset in records:
             sm = meta.get(sid, {})
             tag = sm.get("tag", "")
             pinned = sm.get("pinned", False)
-            file_mtime = os.path.getmtime(jp)
 
-            # Check cache
-            cached = cache.get(sid)
-            if cached and cached.get("mtime") == file_mtime:
+            if offset is None:
                 summary = cached.get("summary", "")
                 fm = cached.get("first_msg", "")
                 fm_long = cached.get("first_msg_long", "")
@@ -413,50 +830,38 @@ class SessionManager:
                 is_cont = cached.get("is_continuation", False)
                 cont_parent = cached.get("parent_id", "")
             else:
-                summary, fm, fm_long, lm = "", "", "", ""
-                sums: List[str] = []
-                msg_count = 0
-                first_entry_sid = ""
-                has_cont_text = False
-                try:
-                    with open(jp, "r", errors="replace") as f:
-                        for ln in f:
-                            try:
-                                d = json.loads(ln)
-                            except Exception:
-                                continue
-                            msg_type = d.get("type")
-                            # Capture sessionId from first entry for parent linking
-                            if not first_entry_sid and d.get("sessionId"):
-                                first_entry_sid = d["sessionId"]
-                            if msg_type == "summary":
-                                s = d.get("summary", "")
-                                if s:
-                                    sums.append(s)
-                                    summary = s
-                            elif msg_type in ("user", "assistant"):
-                                msg_count += 1
-                                if msg_type == "user":
-                                    txt = self._extract_text(d.get("message", {}))
-                                    if txt:
-                                        clean = txt[:120].replace("\n", " ").replace("\t", " ")
-                                        if not fm:
-                                            fm = clean
-                                            fm_long = txt[:800]
-                                        lm = clean
-                                        if not has_cont_text and txt.startswith("This session is being continued"):
-                                            has_cont_text = True
-                except Exception:
-                    pass
-                # Detect continuation: sessionId mismatch AND continuation text present
-                is_cont = bool(
-                    has_cont_text
-                    and first_entry_sid
-                    and first_entry_sid != sid
-                )
-                cont_parent = first_entry_sid if is_cont else ""
+                parsed = parsed_by_sid[sid]
+                if offset:
+                    # File grew since last scan — merge the parsed tail
+                    # with the cached state. The first entry (and hence
+                    # continuation detection) never changes on append, so
+                    # those fields carry over from the cache.
+                    summary = parsed["summary"] or cached.get("summary", "")
+                    fm = cached.get("first_msg", "") or parsed["first_msg"]
+                    fm_long = cached.get("first_msg_long", "") or parsed["first_msg_long"]
+                    lm = parsed["last_msg"] or cached.get("last_msg", "")
+                    sums = cached.get("summaries", []) + parsed["summaries"]
+                    msg_count = cached.get("msg_count", 0) + parsed["msg_count"]
+                    is_cont = cached.get("is_continuation", False)
+                    cont_parent = cached.get("parent_id", "")
+                else:
+                    summary = parsed["summary"]
+                    fm = parsed["first_msg"]
+                    fm_long = parsed["first_msg_long"]
+                    lm = parsed["last_msg"]
+                    sums = parsed["summaries"]
+                    msg_count = parsed["msg_count"]
+                    first_entry_sid = parsed["first_entry_sid"]
+                    # Detect continuation: sessionId mismatch AND continuation text present
+                    is_cont = bool(
+                        parsed["has_cont_text"]
+                        and first_entry_sid
+                        and first_entry_sid != sid
+                    )
+                    cont_parent = first_entry_sid if is_cont else ""
                 cache[sid] = {
                     "mtime": file_mtime,
+                    "size": file_size,
                     "summary": summary,
                     "first_msg": fm,
                     "first_msg_long": fm_long,
@@ -468,7 +873,7 @@ class SessionManager:
                     "is_continuation": is_cont,
                     "parent_id": cont_parent,
                 }
-                cache_dirty = True
+                dirty_sids.add(sid)
 
             # Auto-delete sessions with no user/assistant messages
             if msg_count == 0:
@@ -479,10 +884,11 @@ class SessionManager:
                 empty_sids.append(sid)
                 seen_sids.discard(sid)
                 cache.pop(sid, None)
-                cache_dirty = True
+                dirty_sids.discard(sid)
+                removed_sids.add(sid)
                 continue
 
-            out.append(Session(
+            s = Session(
                 id=sid, project_raw=praw, project_display=pdisp,
                 summary=summary, first_msg=fm,
                 first_msg_long=fm_long, last_msg=lm,
@@ -490,7 +896,9 @@ class SessionManager:
                 mtime=file_mtime, summaries=sums, path=jp,
                 msg_count=msg_count,
                 is_continuation=is_cont, parent_id=cont_parent,
-            ))
+            )
+            s.build_search_blob()
+            out.append(s)
 
         # Batch-delete metadata for empty sessions
         if empty_sids:
@@ -505,18 +913,22 @@ class SessionManager:
             self._save_meta(meta)
 
         # Prune cache entries for sessions no longer on disk
-        prev_len = len(cache)
-        cache = {k: v for k, v in cache.items() if k in seen_sids}
-        if len(cache) != prev_len:
-            cache_dirty = True
+        stale = [k for k in cache if k not in seen_sids]
+        for k in stale:
+            cache.pop(k)
+            removed_sids.add(k)
         self._scan_cache = cache
-        if cache_dirty:
-            try:
-                self._save(CACHE_FILE, cache)
-            except Exception:
-                pass
+        self._save_cache_db(cache, dirty_sids, removed_sids, full=force)
 
         out.sort(key=lambda s: s.get_sort_key(sort_mode))
+
+        # Rebuild lookup indexes for tag / id-prefix resolution
+        by_tag: dict = {}
+        for s in out:
+            if s.tag:
+                by_tag.setdefault(s.tag, []).append(s)
+        self._by_tag = by_tag
+        self._ids_sorted = sorted((s.id, s) for s in out)
         return out
 
     @staticmethod
@@ -583,6 +995,11 @@ class SessionManager:
 
     def load_profiles(self) -> List[dict]:
         data = self._load(PROFILES_FILE, [])
+        # _load memoizes on file mtime; while it hands back the same
+        # object the normalized list is still valid, so skip the
+        # default-profile scan that otherwise runs per keystroke
+        if data is self._profiles_src:
+            return self._profiles_cache
         profiles = data if isinstance(data, list) else []
         # Ensure "default" profile always exists
         if not any(p.get("name") == "default" for p in profiles):
@@ -593,8 +1010,16 @@ class SessionManager:
             }
             profiles.insert(0, default_prof)
             self._save(PROFILES_FILE, profiles)
+        self._profiles_src = data
+        self._profiles_cache = profiles
+        self._profiles_by_name = {p.get("name", ""): p for p in profiles}
         return profiles
 
+    def profiles_by_name(self) -> dict:
+        """name → profile dict, rebuilt only when the profile list reloads."""
+        self.load_profiles()
+        return self._profiles_by_name
+
     def save_profile(self, profile: dict):
         profiles = self.load_profiles()
         # Replace if same name exists
@@ -612,16 +1037,26 @@ class SessionManager:
 
     def load_active_profile_name(self) -> str:
         try:
-            if ACTIVE_PROFILE_FILE.exists():
-                name = ACTIVE_PROFILE_FILE.read_text().strip()
-                if name:
-                    return name
+            mt = os.stat(ACTIVE_PROFILE_FILE).st_mtime_ns
+        except OSError:
+            return "default"
+        if self._active_prof_cache and self._active_prof_cache[0] == mt:
+            return self._active_prof_cache[1]
+        try:
+            name = ACTIVE_PROFILE_FILE.read_text().strip() or "default"
         except Exception:
-            pass
-        return "default"
+            name = "default"
+        self._active_prof_cache = (mt, name)
+        return name
 
     def save_active_profile_name(self, name: str):
         ACTIVE_PROFILE_FILE.write_text(name)
+        try:
+            self._active_prof_cache = (
+                os.stat(ACTIVE_PROFILE_FILE).st_mtime_ns, name
+            )
+        except OSError:
+            self._active_prof_cache = None
 
     # ── Theme management ─────────────────────────────────────────
 
@@ -660,6 +1095,35 @@ class SessionManager:
         except Exception:
             return set()
 
+    def tmux_sessions_activity(self) -> Optional[dict]:
+        """Return {session_id: last_activity_ts} for live ccs tmux sessions.
+
+        One tmux invocation answers both "which sessions are alive" and
+        "when were they last active", so pollers don't need a second
+        list-sessions call. Returns None when tmux can't be queried so
+        callers can tell an error from "no sessions"."""
+        if not HAS_TMUX:
+            return {}
+        try:
+            r = subprocess.run(
+                ["tmux", "list-sessions", "-F", "#{session_name} #{session_activity}"],
+                capture_output=True, text=True, timeout=2,
+            )
+            if r.returncode != 0:
+                # tmux exits non-zero when no server is running
+                return {}
+            out = {}
+            for line in r.stdout.strip().splitlines():
+                name, _, ts = line.strip().rpartition(" ")
+                if name.startswith(TMUX_PREFIX):
+                    try:
+                        out[name[len(TMUX_PREFIX):]] = float(ts)
+                    except ValueError:
+                        out[name[len(TMUX_PREFIX):]] = 0.0
+            return out
+        except Exception:
+            return None
+
     def purge_ephemeral(self):
         meta = self._load_meta()
         ephemeral_sids = [sid for sid, m in meta.items() if m.get("ephemeral")]
@@ -683,24 +1147,36 @@ def strip_ansi(text: str) -> str:
     return _ANSI_RE.sub('', text)
 
 
-def word_wrap(text: str, width: int) -> List[str]:
-    """Word-wrap text to the given width."""
+@functools.lru_cache(maxsize=1024)
+def word_wrap(text: str, width: int) -> Tuple[str, ...]:
+    """Word-wrap text to the given width.
+
+    Tracks the running column and joins each output line once, instead
+    of growing a string word by word (which is quadratic in line
+    length).  Memoized — the detail pane re-wraps the same first
+    message on every rebuild — and returns a tuple so cached results
+    are immutable.
+    """
     lines: List[str] = []
     for para in text.split("\n"):
-        if not para.strip():
+        words = para.split()
+        if not words:
             lines.append("")
             continue
-        words = para.split()
-        line = ""
+        buf: List[str] = []
+        col = 0
         for word in words:
-            if line and len(line) + 1 + len(word) > width:
-                lines.append(line)
-                line = word
+            wl = len(word)
+            if buf and col + 1 + wl > width:
+                lines.append(" ".join(buf))
+                buf = [word]
+                col = wl
             else:
-                line = (line + " " + word) if line else word
-        if line:
-            lines.append(line)
-    return lines
+                buf.append(word)
+                col += wl + 1 if col else wl
+        if buf:
+            lines.append(" ".join(buf))
+    return tuple(lines)
 
 
 def build_args_from_profile(profile: dict) -> List[str]:
@@ -729,35 +1205,55 @@ def build_args_from_profile(profile: dict) -> List[str]:
 
 
 def profile_summary(p: dict) -> str:
-    """One-line summary of a profile's settings."""
-    tmux_label = "[tmux]" if p.get("tmux", True) else "[direct]"
-    expert = p.get("expert_args", "").strip()
+    """One-line summary of a profile's settings.
+
+    Rendered per-profile every time the profiles overlay repaints, so
+    the string assembly is memoized on the fields it reads.
+    """
+    return _profile_summary_cached(
+        p.get("tmux", True),
+        p.get("expert_args", ""),
+        p.get("model", ""),
+        p.get("permission_mode", ""),
+        tuple(p.get("flags", ())),
+        bool(p.get("system_prompt")),
+        p.get("custom_args", ""),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _profile_summary_cached(tmux: bool, expert_args: str, model: str,
+                            perm: str, flags: tuple, has_sysprompt: bool,
+                            custom_args: str) -> str:
+    tmux_label = "[tmux]" if tmux else "[direct]"
+    expert = expert_args.strip()
     if expert:
         label = expert[:50] + ("..." if len(expert) > 50 else "")
         return f"{tmux_label} [expert] {label}"
     parts: List[str] = [tmux_label]
-    model = p.get("model", "")
-    for name, mid in MODELS:
-        if mid == model and name != "default":
-            parts.append(name)
-            break
-    perm = p.get("permission_mode", "")
+    midx = MODEL_IDX.get(model)
+    if midx is not None and MODELS[midx][0] != "default":
+        parts.append(MODELS[midx][0])
     if perm:
         parts.append(perm)
-    for flag in p.get("flags", []):
+    for flag in flags:
         short = flag.lstrip("-")
         if len(short) > 20:
             short = short[:18] + ".."
         parts.append(short)
-    if p.get("system_prompt"):
+    if has_sysprompt:
         parts.append("sys-prompt")
-    if p.get("custom_args"):
-        parts.append("+" + p["custom_args"][:15])
+    if custom_args:
+        parts.append("+" + custom_args[:15])
     return " · ".join(parts) if parts else "default settings"
 
 
-def build_profile_edit_rows(expert_mode: bool) -> List[Tuple[str, int]]:
-    """Build the list of (row_type, index) tuples for profile editor."""
+@functools.lru_cache(maxsize=2)
+def build_profile_edit_rows(expert_mode: bool) -> Tuple[Tuple[str, int], ...]:
+    """Build the tuple of (row_type, index) rows for the profile editor.
+
+    Only two layouts exist (structured/expert) and Tab flips between
+    them, so the result is memoized rather than rebuilt per toggle."""
     rows: List[Tuple[str, int]] = []
     rows.append((ROW_PROF_NAME, 0))
     rows.append((ROW_TMUX, 0))
@@ -773,7 +1269,7 @@ def build_profile_edit_rows(expert_mode: bool) -> List[Tuple[str, int]]:
         rows.append((ROW_MCP, 0))
         rows.append((ROW_CUSTOM, 0))
     rows.append((ROW_PROF_SAVE, 0))
-    return rows
+    return tuple(rows)
 # ── Textual Themes ────────────────────────────────────────────────────
 
 CCS_THEMES = {
@@ -1094,6 +1590,79 @@ def _tc(app, role: str, fallback: str = "") -> str:
     return colors.get(role, fallback)
 
 
+@functools.lru_cache(maxsize=512)
+def _style_for(theme_name: str, role: str, fallback: str = "",
+               bold: bool = False, dim: bool = False,
+               reverse: bool = False) -> Style:
+    """Memoized Style for a theme role — the Style() constructor is
+    surprisingly costly and render paths ask for the same handful of
+    (theme, role, variant) combinations over and over."""
+    colors = _THEME_COLORS.get(theme_name, {})
+    return Style(
+        color=colors.get(role, fallback) or None,
+        bold=True if bold else None,
+        dim=True if dim else None,
+        reverse=True if reverse else None,
+    )
+
+
+def _tstyle(app, role: str, fallback: str = "",
+            bold: bool = False, dim: bool = False,
+            reverse: bool = False) -> Style:
+    """Like _tc but returns a cached Rich Style for the current theme."""
+    theme_name = getattr(app, "_ccs_theme_name", "ccs-dark")
+    return _style_for(theme_name, role, fallback, bold, dim, reverse)
+
+
+@functools.lru_cache(maxsize=64)
+def _badge_style_for(theme_name: str, fg_role: str, fg_fb: str,
+                     bg_role: str, bg_fb: str) -> Style:
+    """Memoized fg-on-bg badge Style (profile badge, back button)."""
+    colors = _THEME_COLORS.get(theme_name, {})
+    return Style(
+        color=colors.get(fg_role, fg_fb) or None,
+        bgcolor=colors.get(bg_role, bg_fb) or None,
+        bold=True,
+    )
+
+
+def _tbadge(app, fg_role: str, fg_fb: str, bg_role: str, bg_fb: str) -> Style:
+    theme_name = getattr(app, "_ccs_theme_name", "ccs-dark")
+    return _badge_style_for(theme_name, fg_role, fg_fb, bg_role, bg_fb)
+
+
+@dataclass(frozen=True, slots=True)
+class _ModalStyles:
+    """The fixed set of styles the modal overlays draw with.
+
+    Built once per theme so overlay repaints index into this bundle
+    instead of re-deriving each combination."""
+    hdr: Style
+    sel: Style
+    dim: Style
+    tag: Style
+    badge: Style
+    warn: Style
+    status: Style
+
+
+@functools.lru_cache(maxsize=16)
+def _modal_styles_for(theme_name: str) -> _ModalStyles:
+    return _ModalStyles(
+        hdr=_style_for(theme_name, "header-color", "#00ffff", bold=True),
+        sel=_style_for(theme_name, "header-color", "#00ffff", bold=True, reverse=True),
+        dim=_style_for(theme_name, "dim-color", "#888888"),
+        tag=_style_for(theme_name, "tag-color", "#00ff00", bold=True),
+        badge=_badge_style_for(theme_name, "badge-fg", "#000000", "badge-bg", "#00aa00"),
+        warn=_style_for(theme_name, "warn-color", "#ff4444", bold=True),
+        status=_style_for(theme_name, "status-color", "#00ff00", bold=True),
+    )
+
+
+def _modal_styles(app) -> _ModalStyles:
+    return _modal_styles_for(getattr(app, "_ccs_theme_name", "ccs-dark"))
+
+
 # ── Default CSS ───────────────────────────────────────────────────────
 
 DEFAULT_CSS = """
@@ -1231,6 +1800,33 @@ class MenuButton(Static):
         )
 
 
+# Static hint lines for the header, per view
+_HINTS_DETAIL = (
+    "←/Esc back · ↑/↓ scroll · Tab switch panel · →/⏎ resume"
+    " · p pin · t tag · d del · m menu"
+)
+_HINTS_SESSIONS = (
+    "↑/↓ nav · → view · ⏎ resume · p pin · t tag"
+    " · n new · / search · s sort · m menu · ? help"
+)
+
+# Sort cycle: next mode and display label per mode, precomputed so the
+# `s` handler and the header are two dict lookups
+_SORT_CYCLE = ("date", "name", "project", "tag", "messages", "tmux")
+_SORT_NEXT = dict(zip(_SORT_CYCLE, _SORT_CYCLE[1:] + _SORT_CYCLE[:1]))
+_SORT_LABELS = {m: m.capitalize() for m in _SORT_CYCLE}
+
+# Detail-view scroll keys → scroll method on the focused pane
+_SCROLL_METHODS = {
+    "up": "scroll_up",
+    "down": "scroll_down",
+    "pageup": "scroll_page_up",
+    "pagedown": "scroll_page_down",
+    "g": "scroll_home",
+    "G": "scroll_end",
+}
+
+
 class HeaderBox(Static):
     """Header showing title, profile badge, view label, and hints."""
 
@@ -1250,84 +1846,75 @@ class HeaderBox(Static):
         Line 3: context-sensitive hints
         Line 4: session count / sort mode
         """
-        tc = lambda role, fb="": _tc(self.app, role, fb)
+        app = self.app
+        dim = _tstyle(app, "dim-color", "#888888")
         text = Text()
 
         # Line 1 -- title
         title = f" \u25c6 CCS v{VERSION} \u2014 Claude Code Session Manager "
-        text.append(title, style=Style(color=tc("header-color", "#00ffff"), bold=True))
+        text.append(title, style=_tstyle(app, "header-color", "#00ffff", bold=True))
         text.append("\n")
 
         # Line 2 -- profile + view
-        text.append("Profile: ", style=Style(color=tc("dim-color", "#888888")))
+        text.append("Profile: ", style=dim)
         text.append(
             f" {self.profile_name} ",
-            style=Style(
-                color=tc("badge-fg", "#000000"),
-                bgcolor=tc("badge-bg", "#00aa00"),
-                bold=True,
-            ),
+            style=_tbadge(app, "badge-fg", "#000000", "badge-bg", "#00aa00"),
         )
-        text.append("  View: ", style=Style(color=tc("dim-color", "#888888")))
+        text.append("  View: ", style=dim)
         text.append(
             f" {self.view_name} ",
-            style=Style(color=tc("tag-color", "#00ff00"), bold=True),
+            style=_tstyle(app, "tag-color", "#00ff00", bold=True),
         )
         if self.view_name == "Session View":
             text.append("  ")
             text.append(
                 " \u25c0 Back ",
-                style=Style(color=tc("badge-fg", "#000000"), bgcolor=tc("dim-color", "#888888"), bold=True),
+                style=_tbadge(app, "badge-fg", "#000000", "dim-color", "#888888"),
             )
         text.append("\n")
 
         # Line 3 -- hints
-        text.append(self.hints, style=Style(color=tc("dim-color", "#888888")))
+        text.append(self.hints, style=dim)
         text.append("\n")
 
         # Line 4 -- info
-        labels = {
-            "date": "Date",
-            "name": "Name",
-            "project": "Project",
-            "tag": "Tag",
-            "messages": "Messages",
-            "tmux": "Tmux",
-        }
-        sort_label = labels.get(self.sort_mode, "Date")
+        sort_label = _SORT_LABELS.get(self.sort_mode, "Date")
         n = self.session_count
         info = f"{n} session{'s' if n != 1 else ''} \u00b7 Sort: {sort_label}"
         text.append(
             info,
-            style=Style(color=tc("accent-color", "#00cccc")),
+            style=_tstyle(app, "accent-color", "#00cccc"),
         )
         if self.search_query:
-            text.append("  \u00b7 Filter: ", style=Style(color=tc("dim-color", "#888888")))
+            text.append("  \u00b7 Filter: ", style=dim)
             text.append(
                 f" {self.search_query} ",
-                style=Style(color=tc("warn-color", "#ff4444"), bold=True, reverse=True),
+                style=_tstyle(app, "warn-color", "#ff4444", bold=True, reverse=True),
             )
-            text.append(" (Esc to clear)", style=Style(color=tc("dim-color", "#888888")))
+            text.append(" (Esc to clear)", style=dim)
 
         return text
 
 
 # ── Row builder helpers ───────────────────────────────────────────────
 
+# Preallocated blank run — row padding slices this instead of allocating
+_PAD = " " * 64
+
 
 def _tmux_state_style(app, state: Optional[str], is_idle: bool) -> Style:
     """Return a Rich Style for the tmux state indicator."""
-    tc = lambda role, fb="": _tc(app, role, fb)
     if is_idle:
-        return Style(color=tc("tmux-idle", "#666666"))
+        return _tstyle(app, "tmux-idle", "#666666")
     if state == "approval":
-        return Style(color=tc("tmux-approval", "#ff4444"), bold=True)
+        return _tstyle(app, "tmux-approval", "#ff4444", bold=True)
     if state == "input":
-        return Style(color=tc("tmux-input", "#ffff00"), bold=True)
+        return _tstyle(app, "tmux-input", "#ffff00", bold=True)
     if state == "done":
-        return Style(color=tc("tmux-idle", "#666666"))
+        return _tstyle(app, "tmux-idle", "#666666")
     # thinking / unknown -> green
-    return Style(color=tc("tmux-thinking", "#00cc00"), bold=True)
+    return _tstyle(app, "tmux-thinking", "#00cc00", bold=True)
 
 
 def _tmux_state_label(state: Optional[str], is_idle: bool) -> str:
@@ -1345,15 +1932,26 @@ def _tmux_state_label(state: Optional[str], is_idle: bool) -> str:
     return ""
 
 
+@functools.lru_cache(maxsize=64)
+def _age_band_style(theme_name: str, band: int) -> Style:
+    """Style for an age band (0=today, 1=this week, 2=older)."""
+    if band == 0:
+        return _style_for(theme_name, "age-today", "#00ff00")
+    if band == 1:
+        return _style_for(theme_name, "age-week", "#ffff00")
+    return _style_for(theme_name, "age-old", "#666666", dim=True)
+
+
 def _age_style(app, mtime: float) -> Style:
-    """Return a Rich Style based on session age."""
-    tc = lambda role, fb="": _tc(app, role, fb)
-    delta = datetime.datetime.now() - datetime.datetime.fromtimestamp(mtime)
-    if delta.days == 0:
-        return Style(color=tc("age-today", "#00ff00"))
-    elif delta.days < 7:
-        return Style(color=tc("age-week", "#ffff00"))
-    return Style(color=tc("age-old", "#666666"), dim=True)
+    """Return a Rich Style based on session age.
+
+    Uses the app's per-frame timestamp (set once per rebuild pass) so a
+    full list render shares one clock read, and resolves the style from
+    a small memo keyed by (theme, age band)."""
+    now = getattr(app, "_now_ts", 0.0) or time.time()
+    days = int((now - mtime) // 86400)
+    band = 0 if days == 0 else (1 if days < 7 else 2)
+    return _age_band_style(getattr(app, "_ccs_theme_name", "ccs-dark"), band)
 
 
 def build_session_row(
@@ -1370,91 +1968,97 @@ def build_session_row(
 
     The *app* argument is used to look up theme colors.
     """
-    tc = lambda role, fb="": _tc(app, role, fb)
-    text = Text()
+    # Collect (text, style) parts and assemble the row in one pass \u2014
+    # cheaper than growing a Text through a dozen append calls.
+    parts = []
 
     # Mark indicator (3 cols)
     if is_marked:
-        text.append(" \u25cf ", style=Style(color=tc("accent-color", "#00cccc"), bold=True))
+        parts.append((" \u25cf ", _tstyle(app, "accent-color", "#00cccc", bold=True)))
     else:
-        text.append("   ")
+        parts.append("   ")
 
     # Pin / tmux icons (3 display-cols)
-    pin_style = Style(color=tc("pin-color", "#ffff00"), bold=True)
+    pin_style = _tstyle(app, "pin-color", "#ffff00", bold=True)
     tmux_ch = "\U0001f4a4" if is_idle else "\u26a1"
     tmux_sty = _tmux_state_style(app, tmux_state, is_idle)
 
     if s.pinned and has_tmux:
-        text.append("\u2605", style=pin_style)
-        text.append(tmux_ch, style=tmux_sty)
+        parts.append(("\u2605", pin_style))
+        parts.append((tmux_ch, tmux_sty))
     elif s.pinned:
-        text.append("\u2605  ", style=pin_style)
+        parts.append(("\u2605  ", pin_style))
     elif has_tmux:
-        text.append(tmux_ch, style=tmux_sty)
-        text.append(" ")
+        parts.append((tmux_ch, tmux_sty))
+        parts.append(" ")
     else:
-        text.append("   ")
+        parts.append("   ")
 
     # Continuation badge on parent, ↳ prefix on continuations
     if show_continuations and s.hide_when_collapsed:
-        text.append("\u21b3", style=Style(dim=True))
+        parts.append(("\u21b3", _tstyle(app, "", dim=True)))
     elif s.continuation_count > 0:
-        text.append(f"+{s.continuation_count}", style=Style(color=tc("accent-color", "#00cccc")))
+        parts.append((f"+{s.continuation_count}", _tstyle(app, "accent-color", "#00cccc")))
     else:
-        text.append("  ")
-    text.append(" ")
+        parts.append("  ")
+    parts.append(" ")
 
-    # Tag column — truncate long tags to [abcdefgh...]
+    # Tag column — long tags are pre-truncated to [abcdefgh...].
+    # Padding slices the preallocated blank run instead of building a
+    # fresh " " * n string per row.
     if s.tag:
-        if len(s.tag) > 8:
-            disp_tag = f"[{s.tag[:8]}...]"
-        else:
-            disp_tag = f"[{s.tag}]"
-        text.append(disp_tag, style=Style(color=tc("tag-color", "#00ff00"), bold=True))
-        pad = max(0, tag_col_w - len(disp_tag))
-        text.append(" " * pad)
+        disp_tag = s.tag_disp or f"[{s.tag}]"
+        parts.append((disp_tag, _tstyle(app, "tag-color", "#00ff00", bold=True)))
+        pad = tag_col_w - len(disp_tag)
+        if pad > 0:
+            parts.append(_PAD[:pad])
     elif tag_col_w:
-        text.append(" " * tag_col_w)
+        parts.append(_PAD[:tag_col_w])
 
     # Timestamp with age coloring
-    age_sty = _age_style(app, s.mtime)
-    text.append(f"{s.ts}  ", style=age_sty)
-
-    # Message count (6 cols)
-    if s.msg_count >= 10000:
-        msg_str = f"{s.msg_count // 1000:>3d}k  "
-    elif s.msg_count >= 1000:
-        msg_str = f"{s.msg_count // 1000}.{(s.msg_count % 1000) // 100}k  "
-    elif s.msg_count:
-        msg_str = f"{s.msg_count:>3d}m  "
-    else:
-        msg_str = "      "
-    text.append(msg_str, style=Style(color=tc("dim-color", "#888888")))
+    parts.append((f"{s.ts}  ", _age_style(app, s.mtime)))
+
+    # Message count (6 cols) — precomputed in build_search_blob
+    parts.append((s.msg_disp or "      ", _tstyle(app, "dim-color", "#888888")))
 
     # Project (24 cols)
     proj = s.project_display
     if len(proj) > 24:
         proj = proj[:22] + ".."
-    text.append(
-        f"{proj:<24s} ",
-        style=Style(color=tc("project-color", "#cc00cc")),
-    )
+    parts.append((f"{proj:<24s} ", _tstyle(app, "project-color", "#cc00cc")))
 
     # Description (remainder)
     desc = s.label
     if len(desc) > 50:
         desc = desc[:49] + "\u2026"
     if show_continuations and s.hide_when_collapsed:
-        text.append(desc, style=Style(dim=True))
+        parts.append((desc, _tstyle(app, "", dim=True)))
     else:
-        text.append(desc)
+        parts.append(desc)
 
-    return text
+    return Text.assemble(*parts)
 
 
 # ── SessionListWidget ─────────────────────────────────────────────────
 
 
+def _tag_col_width(sessions: list) -> int:
+    """Width of the tag column: widest displayed tag + padding.
+
+    Tags > 8 chars are truncated to [abcdefgh...] = 13 chars + space = 14.
+    """
+    max_tag_w = 0
+    for s in sessions:
+        if s.tag:
+            if len(s.tag) > 8:
+                tw = 14  # "[" + 8 + "..." + "]" + " "
+            else:
+                tw = len(s.tag) + 3  # "[" + tag + "] "
+            if tw > max_tag_w:
+                max_tag_w = tw
+    return max_tag_w
+
+
 class SessionListWidget(OptionList):
     """Scrollable session list with Rich Text rows."""
 
@@ -1469,30 +2073,62 @@ class SessionListWidget(OptionList):
         tmux_claude_state: dict,
         marked: set,
         show_continuations: bool = False,
+        tag_col_w: Optional[int] = None,
     ):
-        """Clear and rebuild the option list from *sessions*."""
-        # Compute tag column width (widest displayed tag + padding)
-        # Tags > 8 chars are truncated to [abcdefgh...] = 13 chars + space = 14
-        max_tag_w = 0
-        for s in sessions:
-            if s.tag:
-                tw = min(len(s.tag), 8) + 3  # "[" + tag(max 8) + "] "
-                if len(s.tag) > 8:
-                    tw = 14  # "[" + 8 + "..." + "]" + " "
-                if tw > max_tag_w:
-                    max_tag_w = tw
-
-        self.clear_options()
-        for s in sessions:
+        """Clear and rebuild the option list from *sessions*.
+
+        The caller may pass a precomputed *tag_col_w* (it also needs the
+        value for the column header) to avoid a second pass here."""
+        max_tag_w = _tag_col_width(sessions) if tag_col_w is None else tag_col_w
+
+        # Reuse rendered Text rows from the previous rebuild when every
+        # input that affects a row is unchanged — most rebuilds (poll
+        # ticks, mark toggles) touch only a handful of rows.
+        old_cache = getattr(self, "_row_cache", {})
+        new_cache: dict = {}
+        theme = getattr(self.app, "_ccs_theme_name", "")
+        now = getattr(self.app, "_now_ts", 0.0) or time.time()
+
+        opts = []
+        changed_rows = []  # (index, Text) for rows whose key changed
+        for idx, s in enumerate(sessions):
             has_tmux = s.id in tmux_sids
             is_idle = s.id in tmux_idle
             tmux_state = tmux_claude_state.get(s.id)
             is_marked = s.id in marked
-            row = build_session_row(
-                self.app, s, has_tmux, is_idle, tmux_state,
-                is_marked, max_tag_w, show_continuations,
+            # Age coloring shifts at day boundaries; bucket it into the key
+            day_age = int((now - s.mtime) // 86400)
+            age_band = 0 if day_age == 0 else (1 if day_age < 7 else 2)
+            key = (
+                s.mtime, s.msg_count, s.tag, s.pinned, s.label,
+                s.project_display, s.continuation_count,
+                s.hide_when_collapsed, has_tmux, is_idle, tmux_state,
+                is_marked, max_tag_w, show_continuations, theme, age_band,
             )
-            self.add_option(Option(row, id=s.id))
+            ent = old_cache.get(s.id)
+            if ent is None or ent[0] != key:
+                row = build_session_row(
+                    self.app, s, has_tmux, is_idle, tmux_state,
+                    is_marked, max_tag_w, show_continuations,
+                )
+                ent = (key, row)
+                changed_rows.append((idx, row))
+            new_cache[s.id] = ent
+            opts.append(Option(ent[1], id=s.id))
+        self._row_cache = new_cache
+
+        # When the set/order of sessions is unchanged (the common case
+        # for poll ticks and single-row updates), patch prompts in place
+        # instead of tearing down and rebuilding every option.
+        new_ids = [s.id for s in sessions]
+        if getattr(self, "_prev_ids", None) == new_ids:
+            for idx, row in changed_rows:
+                self.replace_option_prompt_at_index(idx, row)
+        else:
+            self.clear_options()
+            if opts:
+                self.add_options(opts)
+        self._prev_ids = new_ids
 
 
 # ── Session metadata helper ──────────────────────────────────────────
@@ -1514,32 +2150,32 @@ def _append_session_meta(
     *app* is used for theme-aware color lookups.  When ``None``, sensible
     fallback colors are used.
     """
-    tc = lambda role, fb="": _tc(app, role, fb) if app else fb
+    dim = _tstyle(app, "dim-color", "#888888")
 
     # Tag
     if s.tag:
         text.append(
             f"  Tag:     {s.tag}\n",
-            style=Style(color=tc("tag-color", "#00ff00"), bold=True),
+            style=_tstyle(app, "tag-color", "#00ff00", bold=True),
         )
 
     # Session ID (truncated) with optional pinned indicator
     sid_display = s.id[:36] + ("..." if len(s.id) > 36 else "")
     text.append(
         f"  Session: {sid_display}",
-        style=Style(color=tc("dim-color", "#888888")),
+        style=dim,
     )
     if s.pinned:
         text.append(
             " (pinned)",
-            style=Style(color=tc("pin-color", "#ffff00")),
+            style=_tstyle(app, "pin-color", "#ffff00"),
         )
     text.append("\n")
 
     # Project
     text.append(
         f"  Project: {s.project_display}\n",
-        style=Style(color=tc("project-color", "#cc00cc")),
+        style=_tstyle(app, "project-color", "#cc00cc"),
     )
 
     # Modified timestamp with age coloring
@@ -1558,7 +2194,7 @@ def _append_session_meta(
     # Message count
     text.append(
         f"  Messages: {s.msg_count}\n",
-        style=Style(color=tc("accent-color", "#00cccc")),
+        style=_tstyle(app, "accent-color", "#00cccc"),
     )
 
     # Tmux status
@@ -1581,9 +2217,9 @@ def _append_session_meta(
             icon = "\u26a1"
             label = state_labels.get(state, "active")
         kill_hint = "  (k to kill)" if detail else ""
-        text.append(f"  Tmux:    {icon} {tmux_name} — ", style=Style(color=tc("dim-color", "#888888")))
+        text.append(f"  Tmux:    {icon} {tmux_name} — ", style=dim)
         text.append(f"{label}", style=state_sty)
-        text.append(f"{kill_hint}\n", style=Style(color=tc("dim-color", "#888888")))
+        text.append(f"{kill_hint}\n", style=dim)
 
     # Git info (from project path)
     proj_path = os.path.expanduser(s.project_display) if s.project_display else ""
@@ -1594,7 +2230,7 @@ def _append_session_meta(
             branch_str = f" ({branch})" if branch else ""
             text.append(
                 f"  Git:     {repo_name}{branch_str}\n",
-                style=Style(color=tc("accent-color", "#00cccc")),
+                style=_tstyle(app, "accent-color", "#00cccc"),
             )
 
 
@@ -1604,6 +2240,12 @@ def _append_session_meta(
 class PreviewPane(Static):
     """Session metadata preview panel (bottom of sessions view)."""
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Distinct from None (the no-session marker) so the placeholder
+        # still paints on the very first render of an empty list.
+        self._last_key = ()
+
     def update_preview(
         self,
         s: Optional[Session],
@@ -1615,8 +2257,22 @@ class PreviewPane(Static):
     ):
         """Rebuild the preview content for session *s*."""
         if s is None:
-            self.update(Text("Select a session to preview", style="dim"))
+            if self._last_key is not None:
+                self._last_key = None
+                self.update(Text("Select a session to preview", style="dim"))
+            return
+
+        proj_key = os.path.expanduser(s.project_display) if s.project_display else ""
+        key = (
+            s.id, s.mtime, s.msg_count, s.tag, s.pinned, s.label, s.age,
+            s.id in tmux_sids, s.id in tmux_idle,
+            tmux_claude_state.get(s.id),
+            id(git_cache.get(proj_key)) if proj_key else None,
+            getattr(self.app, "_ccs_theme_name", ""),
+        )
+        if key == self._last_key:
             return
+        self._last_key = key
         text = Text()
         _append_session_meta(
             text, s, mgr, tmux_sids, tmux_idle,
@@ -1629,7 +2285,7 @@ class PreviewPane(Static):
         ):
             text.append(
                 "  (empty session \u2014 no messages yet)\n",
-                style=Style(color=_tc(self.app, "dim-color", "#888888")),
+                style=_tstyle(self.app, "dim-color", "#888888"),
             )
         self.update(text)
 
@@ -1640,6 +2296,12 @@ class PreviewPane(Static):
 class InfoPane(Static):
     """Detailed session info panel (top of detail view)."""
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Distinct from None (the no-session marker) so the placeholder
+        # still paints on the very first render of an empty list.
+        self._last_key = ()
+
     def update_info(
         self,
         s: Optional[Session],
@@ -1652,10 +2314,27 @@ class InfoPane(Static):
     ):
         """Rebuild the detailed info content for session *s*."""
         if s is None:
-            self.update(Text("Select a session to preview", style="dim"))
+            if self._last_key is not None:
+                self._last_key = None
+                self.update(Text("Select a session to preview", style="dim"))
             return
 
-        tc = lambda role, fb="": _tc(self.app, role, fb)
+        # Skip the rebuild (including word-wrapping the first message) when
+        # nothing that feeds the render has changed since the last tick.
+        proj_key = os.path.expanduser(s.project_display) if s.project_display else ""
+        key = (
+            s.id, s.mtime, s.msg_count, s.tag, s.pinned, s.label, s.age,
+            s.id in tmux_sids, s.id in tmux_idle,
+            tmux_claude_state.get(s.id), bool(tmux_pane_cache.get(s.id)),
+            id(git_cache.get(proj_key)) if proj_key else None,
+            getattr(self.app, "_ccs_theme_name", ""),
+        )
+        if key == self._last_key:
+            return
+        self._last_key = key
+
+        dim = _tstyle(self.app, "dim-color", "#888888")
+        hdr = _tstyle(self.app, "header-color", "#00ffff", bold=True)
         text = Text()
         _append_session_meta(
             text, s, mgr, tmux_sids, tmux_idle,
@@ -1663,15 +2342,11 @@ class InfoPane(Static):
         )
 
         # Git commit log (detail view only)
-        proj_path = os.path.expanduser(s.project_display) if s.project_display else ""
-        git_info = git_cache.get(proj_path) if proj_path else None
+        git_info = git_cache.get(proj_key) if proj_key else None
         if git_info:
             _repo, _branch, commits = git_info
             for sha, subject in commits:
-                text.append(
-                    f"    {sha} {subject}\n",
-                    style=Style(color=tc("dim-color", "#888888")),
-                )
+                text.append(f"    {sha} {subject}\n", style=dim)
 
         # First message + topics (only if no tmux pane content)
         has_tmux = s.id in tmux_sids
@@ -1679,24 +2354,18 @@ class InfoPane(Static):
         if not has_tmux or not has_pane:
             if s.first_msg_long:
                 text.append("\n")
-                text.append(
-                    "  First Message:\n",
-                    style=Style(color=tc("header-color", "#00ffff"), bold=True),
-                )
+                text.append("  First Message:\n", style=hdr)
                 for wl in word_wrap(s.first_msg_long, 80):
                     text.append(f"    {wl}\n")
             if s.summaries:
                 text.append("\n")
-                text.append(
-                    "  Topics:\n",
-                    style=Style(color=tc("header-color", "#00ffff"), bold=True),
-                )
+                text.append("  Topics:\n", style=hdr)
                 for sm in s.summaries[-6:]:
                     text.append(f"    \u2022 {sm[:80]}\n")
             elif not s.first_msg_long:
                 text.append(
                     "  (empty session \u2014 no messages yet)\n",
-                    style=Style(color=tc("dim-color", "#888888")),
+                    style=dim,
                 )
 
         self.update(text)
@@ -1751,12 +2420,11 @@ class TmuxPane(RichLog):
             "done": "session ended",
             "unknown": "active",
         }
-        tc = lambda role, fb="": _tc(self.app, role, fb)
         self.auto_scroll = was_at_bottom
         self.write(
             Text(
                 f"Output ({state_labels.get(state, 'active')}):",
-                style=Style(color=tc("header-color", "#00ffff"), bold=True),
+                style=_tstyle(self.app, "header-color", "#00ffff", bold=True),
             )
         )
 
@@ -1781,17 +2449,17 @@ class FooterBar(Static):
     marked_count = reactive(0)
 
     def render(self) -> Text:
-        tc = lambda role, fb="": _tc(self.app, role, fb)
+        dim = _tstyle(self.app, "dim-color", "#888888")
         text = Text()
 
         if self.status:
             text.append(
                 f" {self.status} ",
-                style=Style(color=tc("status-color", "#00ff00"), bold=True),
+                style=_tstyle(self.app, "status-color", "#00ff00", bold=True),
             )
         else:
-            text.append(" ccs ", style=Style(color=tc("dim-color", "#888888")))
-            text.append("? help", style=Style(color=tc("dim-color", "#888888")))
+            text.append(" ccs ", style=dim)
+            text.append("? help", style=dim)
 
         # Right side: marked count + position
         right_parts: list = []
@@ -1802,11 +2470,86 @@ class FooterBar(Static):
         if right_parts:
             right = " \u00b7 ".join(right_parts)
             text.append("  ")
-            text.append(right, style=Style(color=tc("dim-color", "#888888")))
+            text.append(right, style=dim)
 
         return text
 # ── Modal Screens ────────────────────────────────────────────────────
 
+# Shared key predicates for modal on_key handlers — frozensets beat
+# rebuilding a tuple literal per keypress
+_ENTER_KEYS = frozenset(("enter", "return"))
+_YES_KEYS = frozenset(("y", "Y"))
+_NO_KEYS = frozenset(("n", "N", "escape"))
+
+
+@functools.lru_cache(maxsize=8)
+def _build_help_text(view: str, theme_name: str) -> Text:
+    """Build the (static) help text for *view* once per theme.
+
+    The content never changes at runtime, so reopening the overlay is a
+    cache hit instead of re-appending ~40 styled lines.
+    """
+    hdr = _style_for(theme_name, "header-color", "#00ffff", bold=True)
+    dim = _style_for(theme_name, "dim-color", "#888888")
+    text = Text()
+
+    if view == "detail":
+        text.append("Session View\n\n", style=Style(bold=True))
+        text.append("Panes\n", style=hdr)
+        text.append("  Tab            Switch Info / Tmux pane\n")
+        text.append("  ↑ / ↓          Scroll focused pane\n")
+        text.append("  PgUp / PgDn    Page up / down\n")
+        text.append("  g / G          Scroll to top / bottom\n\n")
+        text.append("Actions\n", style=hdr)
+        text.append("  ⏎              Resume / attach session\n")
+        text.append("  k              Kill tmux session\n")
+        text.append("  i              Send text to tmux (Ctrl+D to send)\n")
+        text.append("  p              Toggle pin\n")
+        text.append("  t / T          Set / remove tag\n")
+        text.append("  d              Delete Claude session\n\n")
+        text.append("Other\n", style=hdr)
+        text.append("  P              Profile picker / manager\n")
+        text.append("  H              Cycle theme\n")
+        text.append("  r              Refresh session list\n")
+        text.append("  S              Rescan all Claude sessions\n")
+        text.append("  Esc / ←        Back to Sessions list\n")
+        text.append("  Ctrl-C         Quit\n")
+    else:
+        text.append("Sessions List\n\n", style=Style(bold=True))
+        text.append("Navigation\n", style=hdr)
+        text.append("  ↑              Move up\n")
+        text.append("  ↓              Move down\n")
+        text.append("  g / G          Jump to first / last\n")
+        text.append("  PgUp / PgDn    Page up / down\n")
+        text.append("  →              Open Session View\n\n")
+        text.append("Actions\n", style=hdr)
+        text.append("  ⏎              Resume with active profile\n")
+        text.append("  P              Profile picker / manager\n")
+        text.append("  p              Toggle pin (bulk if marked)\n")
+        text.append("  t / T          Set / remove tag\n")
+        text.append("  d              Delete session (bulk if marked)\n")
+        text.append("  D              Delete all empty sessions\n")
+        text.append("  C              Toggle continuations\n")
+        text.append("  k              Kill tmux session\n")
+        text.append("  K              Kill all tmux sessions\n\n")
+        text.append("Bulk & Sort\n", style=hdr)
+        text.append("  Space          Mark / unmark session\n")
+        text.append("  u              Unmark all\n")
+        text.append("  s              Cycle sort mode\n")
+        text.append("  /              Search / filter sessions\n\n")
+        text.append("Sessions\n", style=hdr)
+        text.append("  n              Create a new named session\n")
+        text.append("  e              Start an ephemeral session\n\n")
+        text.append("Other\n", style=hdr)
+        text.append("  H              Cycle theme\n")
+        text.append("  r              Refresh session list\n")
+        text.append("  S              Rescan all Claude sessions\n")
+        text.append("  Esc            Quit\n")
+        text.append("  Ctrl-C         Quit\n")
+
+    text.append("\nPress any key to close", style=dim)
+    return text
+
 
 class HelpModal(ModalScreen):
     """Help overlay showing keyboard shortcuts."""
@@ -1835,67 +2578,10 @@ class HelpModal(ModalScreen):
             yield Static(id="help-text")
 
     def on_mount(self):
-        tc = lambda role, fb="": _tc(self.app, role, fb)
-        hdr = Style(color=tc("header-color", "#00ffff"), bold=True)
-        dim = Style(color=tc("dim-color", "#888888"))
-        text = Text()
-
-        if self.help_view == "detail":
-            text.append("Session View\n\n", style=Style(bold=True))
-            text.append("Panes\n", style=hdr)
-            text.append("  Tab            Switch Info / Tmux pane\n")
-            text.append("  \u2191 / \u2193          Scroll focused pane\n")
-            text.append("  PgUp / PgDn    Page up / down\n")
-            text.append("  g / G          Scroll to top / bottom\n\n")
-            text.append("Actions\n", style=hdr)
-            text.append("  \u23ce              Resume / attach session\n")
-            text.append("  k              Kill tmux session\n")
-            text.append("  i              Send text to tmux (Ctrl+D to send)\n")
-            text.append("  p              Toggle pin\n")
-            text.append("  t / T          Set / remove tag\n")
-            text.append("  d              Delete Claude session\n\n")
-            text.append("Other\n", style=hdr)
-            text.append("  P              Profile picker / manager\n")
-            text.append("  H              Cycle theme\n")
-            text.append("  r              Refresh session list\n")
-            text.append("  S              Rescan all Claude sessions\n")
-            text.append("  Esc / \u2190        Back to Sessions list\n")
-            text.append("  Ctrl-C         Quit\n")
-        else:
-            text.append("Sessions List\n\n", style=Style(bold=True))
-            text.append("Navigation\n", style=hdr)
-            text.append("  \u2191              Move up\n")
-            text.append("  \u2193              Move down\n")
-            text.append("  g / G          Jump to first / last\n")
-            text.append("  PgUp / PgDn    Page up / down\n")
-            text.append("  \u2192              Open Session View\n\n")
-            text.append("Actions\n", style=hdr)
-            text.append("  \u23ce              Resume with active profile\n")
-            text.append("  P              Profile picker / manager\n")
-            text.append("  p              Toggle pin (bulk if marked)\n")
-            text.append("  t / T          Set / remove tag\n")
-            text.append("  d              Delete session (bulk if marked)\n")
-            text.append("  D              Delete all empty sessions\n")
-            text.append("  C              Toggle continuations\n")
-            text.append("  k              Kill tmux session\n")
-            text.append("  K              Kill all tmux sessions\n\n")
-            text.append("Bulk & Sort\n", style=hdr)
-            text.append("  Space          Mark / unmark session\n")
-            text.append("  u              Unmark all\n")
-            text.append("  s              Cycle sort mode\n")
-            text.append("  /              Search / filter sessions\n\n")
-            text.append("Sessions\n", style=hdr)
-            text.append("  n              Create a new named session\n")
-            text.append("  e              Start an ephemeral session\n\n")
-            text.append("Other\n", style=hdr)
-            text.append("  H              Cycle theme\n")
-            text.append("  r              Refresh session list\n")
-            text.append("  S              Rescan all Claude sessions\n")
-            text.append("  Esc            Quit\n")
-            text.append("  Ctrl-C         Quit\n")
-
-        text.append("\nPress any key to close", style=dim)
-        self.query_one("#help-text", Static).update(text)
+        theme = getattr(self.app, "_ccs_theme_name", "ccs-dark")
+        self.query_one("#help-text", Static).update(
+            _build_help_text(self.help_view, theme)
+        )
         # Disable scrollable container bindings so keys reach on_key
         self.query_one("#help-box", ScrollableContainer).BINDINGS = []
 
@@ -1951,11 +2637,11 @@ class InfoModal(ModalScreen):
         box.styles.border = ("heavy", color)
         text = Text()
         text.append(f"{self.title_text}\n\n", style=Style(color=color, bold=True))
-        text.append(self.message_text, style=Style(color=tc("dim-color", "#888888")))
+        text.append(self.message_text, style=_tstyle(self.app, "dim-color", "#888888"))
         self.query_one("#info-modal-message", Static).update(text)
         ok_style = Style(color=color, bold=True, reverse=True)
         self.query_one("#info-modal-ok", Static).update(Text("  OK  ", style=ok_style, justify="center"))
-        hints = Text("Enter/Esc/Click to close", style=Style(color=tc("dim-color", "#555555")), justify="center")
+        hints = Text("Enter/Esc/Click to close", style=_tstyle(self.app, "dim-color", "#555555"), justify="center")
         self.query_one("#info-modal-hints", Static).update(hints)
 
     def on_click(self, event):
@@ -2021,18 +2707,17 @@ class ConfirmModal(ModalScreen[bool]):
         text.append(f"{self.title_text}\n\n", style=Style(color=color, bold=True))
         text.append(f"{self.message_text}", style=Style(color=color))
         if self.detail_text:
-            text.append(f"\n\n{self.detail_text}", style=Style(color=tc("dim-color", "#888888")))
+            text.append(f"\n\n{self.detail_text}", style=_tstyle(self.app, "dim-color", "#888888"))
         self.query_one("#confirm-message", Static).update(text)
         hints = Text("\u2190/\u2192 Select  \u00b7  \u23ce/y Confirm  \u00b7  Esc/n Cancel",
-                     style=Style(color=tc("dim-color", "#888888")), justify="center")
+                     style=_tstyle(self.app, "dim-color", "#888888"), justify="center")
         self.query_one("#confirm-hints", Static).update(hints)
         self._render_buttons()
 
     def _render_buttons(self):
-        tc = lambda role, fb="": _tc(self.app, role, fb)
         color = self._get_color()
         sel_style = Style(color=color, bold=True, reverse=True)
-        dim_style = Style(color=tc("dim-color", "#888888"))
+        dim_style = _tstyle(self.app, "dim-color", "#888888")
         text = Text(justify="center")
         yes_label = "  Yes (y)  "
         no_label = "  No (n/Esc)  "
@@ -2062,11 +2747,11 @@ class ConfirmModal(ModalScreen[bool]):
         key = event.key
         event.stop()
         event.prevent_default()
-        if key in ("y", "Y", "ctrl+c"):
+        if key in _YES_KEYS or key == "ctrl+c":
             self.dismiss(True)
-        elif key in ("n", "N", "escape"):
+        elif key in _NO_KEYS:
             self.dismiss(False)
-        elif key in ("enter", "return"):
+        elif key in _ENTER_KEYS:
             self.dismiss(self.sel == 0)
         elif key in ("left", "right", "up", "down"):
             self.sel = 1 - self.sel
@@ -2128,37 +2813,37 @@ class LaunchModal(ModalScreen[str]):
             yield Static(id="launch-hints")
 
     def on_mount(self):
-        tc = lambda role, fb="": _tc(self.app, role, fb)
         title = Text(justify="center")
-        title.append("Launch Mode\n\n", style=Style(color=tc("header-color", "#00ffff"), bold=True))
-        title.append(f"Resume: {self.session_label}", style=Style(color=tc("header-color", "#00ffff")))
+        title.append("Launch Mode\n\n", style=_tstyle(self.app, "header-color", "#00ffff", bold=True))
+        title.append(f"Resume: {self.session_label}", style=_tstyle(self.app, "header-color", "#00ffff"))
         self.query_one("#launch-title", Static).update(title)
         hints = Text("\u2190/\u2192/\u2191/\u2193 Select  \u00b7  \u23ce Confirm  \u00b7  Esc/n Cancel",
-                     style=Style(color=tc("dim-color", "#888888")), justify="center")
+                     style=_tstyle(self.app, "dim-color", "#888888"), justify="center")
         self.query_one("#launch-hints", Static).update(hints)
         self._render_options()
 
     def _render_options(self):
-        tc = lambda role, fb="": _tc(self.app, role, fb)
-        sel_style = Style(color=tc("header-color", "#00ffff"), bold=True, reverse=True)
-        dim_style = Style(color=tc("dim-color", "#888888"))
+        sel_style = _tstyle(self.app, "header-color", "#00ffff", bold=True, reverse=True)
+        dim_style = _tstyle(self.app, "dim-color", "#888888")
         disabled_style = Style(color="#555555", dim=True)
         cancel_idx = len(self._actions) - 1
 
-        for i in range(len(self._actions)):
-            label = self._labels[i]
-            if i == cancel_idx:
-                label = f"{label} (Esc/n)"
-            padded = f"  {label}  "
-            if i == 0 and not HAS_TMUX:
-                style = disabled_style
-            elif i == self.sel:
-                style = sel_style
-            else:
-                style = dim_style
-            self.query_one(f"#launch-opt-{i}", Static).update(
-                Text(padded, style=style, justify="center")
-            )
+        # One screen update for the whole option column, not one per row
+        with self.app.batch_update():
+            for i in range(len(self._actions)):
+                label = self._labels[i]
+                if i == cancel_idx:
+                    label = f"{label} (Esc/n)"
+                padded = f"  {label}  "
+                if i == 0 and not HAS_TMUX:
+                    style = disabled_style
+                elif i == self.sel:
+                    style = sel_style
+                else:
+                    style = dim_style
+                self.query_one(f"#launch-opt-{i}", Static).update(
+                    Text(padded, style=style, justify="center")
+                )
 
     def on_click(self, event):
         for i in range(len(self._actions)):
@@ -2183,10 +2868,10 @@ class LaunchModal(ModalScreen[str]):
         event.stop()
         event.prevent_default()
 
-        if key in ("escape", "n", "N"):
+        if key in _NO_KEYS:
             self.dismiss(None)
             return
-        if key in ("enter", "return"):
+        if key in _ENTER_KEYS:
             self.dismiss(self._actions[self.sel])
             return
 
@@ -2244,13 +2929,12 @@ class InputModal(ModalScreen[str]):
             yield Static(id="input-hints")
 
     def on_mount(self):
-        tc = lambda role, fb="": _tc(self.app, role, fb)
         text = Text()
-        text.append(f"Send to {self.target_name}", style=Style(color=tc("header-color", "#00ffff"), bold=True))
+        text.append(f"Send to {self.target_name}", style=_tstyle(self.app, "header-color", "#00ffff", bold=True))
         if self.subtitle:
-            text.append(f"\n{self.subtitle}", style=Style(color=tc("dim-color", "#888888")))
+            text.append(f"\n{self.subtitle}", style=_tstyle(self.app, "dim-color", "#888888"))
         self.query_one("#input-title", Static).update(text)
-        hints = Text("Ctrl+D Send  \u00b7  \u23ce New line  \u00b7  Esc Cancel/Skip", style=Style(color=tc("dim-color", "#888888")))
+        hints = Text("Ctrl+D Send  \u00b7  \u23ce New line  \u00b7  Esc Cancel/Skip", style=_tstyle(self.app, "dim-color", "#888888"))
         self.query_one("#input-hints", Static).update(hints)
         self.query_one("#input-area", TextArea).focus()
 
@@ -2312,10 +2996,9 @@ class SimpleInputModal(ModalScreen[str]):
             yield Static(id="simple-input-hints")
 
     def on_mount(self):
-        tc = lambda role, fb="": _tc(self.app, role, fb)
-        title = Text(self.title_text, style=Style(color=tc("header-color", "#00ffff"), bold=True))
+        title = Text(self.title_text, style=_tstyle(self.app, "header-color", "#00ffff", bold=True))
         self.query_one("#simple-input-title", Static).update(title)
-        hints = Text("\u23ce Confirm  \u00b7  Esc Cancel", style=Style(color=tc("dim-color", "#888888")))
+        hints = Text("\u23ce Confirm  \u00b7  Esc Cancel", style=_tstyle(self.app, "dim-color", "#888888"))
         self.query_one("#simple-input-hints", Static).update(hints)
         inp = self.query_one("#simple-input-field", Input)
         inp.focus()
@@ -2375,6 +3058,7 @@ class PathInputModal(ModalScreen[str]):
         self._completions: List[str] = []
         self._comp_idx = -1
         self._last_input = ""
+        self._comp_timer = None
 
     def compose(self) -> ComposeResult:
         with Vertical(id="path-input-container"):
@@ -2384,11 +3068,10 @@ class PathInputModal(ModalScreen[str]):
             yield Static(id="path-input-hints")
 
     def on_mount(self):
-        tc = lambda role, fb="": _tc(self.app, role, fb)
-        title = Text(self.title_text, style=Style(color=tc("header-color", "#00ffff"), bold=True))
+        title = Text(self.title_text, style=_tstyle(self.app, "header-color", "#00ffff", bold=True))
         self.query_one("#path-input-title", Static).update(title)
         hints = Text("\u2191\u2193 Navigate  \u00b7  Tab Select  \u00b7  \u23ce Confirm  \u00b7  Esc Cancel",
-                      style=Style(color=tc("dim-color", "#888888")))
+                      style=_tstyle(self.app, "dim-color", "#888888"))
         self.query_one("#path-input-hints", Static).update(hints)
         inp = self.query_one("#path-input-field", Input)
         inp.focus()
@@ -2408,17 +3091,26 @@ class PathInputModal(ModalScreen[str]):
         if not os.path.isdir(parent):
             return []
         try:
+            # scandir gets the dir/file bit from the directory entry
+            # itself — one readdir instead of a stat per candidate
             entries = []
             home = str(Path.home())
-            for name in sorted(os.listdir(parent)):
-                if name.startswith("."):
-                    continue
-                full = os.path.join(parent, name)
-                if os.path.isdir(full) and name.lower().startswith(prefix):
+            with os.scandir(parent) as it:
+                for de in it:
+                    name = de.name
+                    if name.startswith(".") or not name.lower().startswith(prefix):
+                        continue
+                    try:
+                        if not de.is_dir():
+                            continue
+                    except OSError:
+                        continue
+                    full = de.path
                     if full.startswith(home):
                         entries.append("~" + full[len(home):])
                     else:
                         entries.append(full)
+            entries.sort()
             return entries
         except OSError:
             return []
@@ -2429,7 +3121,6 @@ class PathInputModal(ModalScreen[str]):
         self._show_completions()
 
     def _show_completions(self):
-        tc = lambda role, fb="": _tc(self.app, role, fb)
         comp_widget = self.query_one("#path-completions", Static)
         if not self._completions:
             comp_widget.update("")
@@ -2447,22 +3138,29 @@ class PathInputModal(ModalScreen[str]):
             if end > total:
                 end = total
                 start = end - max_visible
-        for i in range(start, end):
-            c = self._completions[i]
+        sel_style = _tstyle(self.app, "accent-color", "#00cccc", bold=True)
+        dim_style = _tstyle(self.app, "dim-color", "#888888")
+        for i, c in enumerate(self._completions[start:end], start):
             if i == self._comp_idx:
-                text.append(f"  \u25b6 {c}\n", style=Style(color=tc("accent-color", "#00cccc"), bold=True))
+                text.append(f"  \u25b6 {c}\n", style=sel_style)
             else:
-                text.append(f"    {c}\n", style=Style(color=tc("dim-color", "#888888")))
+                text.append(f"    {c}\n", style=dim_style)
         if total > max_visible:
             text.append(f"    ({total} directories)",
-                        style=Style(color=tc("dim-color", "#666666")))
+                        style=_tstyle(self.app, "dim-color", "#666666"))
         comp_widget.update(text)
 
     def on_input_changed(self, event: Input.Changed):
         val = event.value
         if val != self._last_input:
             self._last_input = val
-            self._refresh_completions(val)
+            # Debounce: a paste fires one changed event per character,
+            # so only the last value within the window hits the disk
+            if self._comp_timer is not None:
+                self._comp_timer.stop()
+            self._comp_timer = self.set_timer(
+                0.05, lambda: self._refresh_completions(self._last_input)
+            )
 
     def on_key(self, event) -> None:
         if event.key in ("down", "up") and self._completions:
@@ -2552,19 +3250,18 @@ class ThemeModal(ModalScreen[str]):
             yield Static(id="theme-hints")
 
     def on_mount(self):
-        tc = lambda role, fb="": _tc(self.app, role, fb)
-        title = Text("Select Theme", style=Style(color=tc("header-color", "#00ffff"), bold=True))
+        title = Text("Select Theme", style=_tstyle(self.app, "header-color", "#00ffff", bold=True))
         self.query_one("#theme-title", Static).update(title)
         hints = Text("\u2191/\u2193 navigate  \u00b7  \u23ce select  \u00b7  Esc cancel",
-                     style=Style(color=tc("dim-color", "#888888")), justify="center")
+                     style=_tstyle(self.app, "dim-color", "#888888"), justify="center")
         self.query_one("#theme-hints", Static).update(hints)
         self._refresh_display()
 
     def _refresh_display(self):
-        tc = lambda role, fb="": _tc(self.app, role, fb)
-        sel_style = Style(color=tc("header-color", "#00ffff"), bold=True, reverse=True)
-        dim_style = Style(color=tc("dim-color", "#888888"))
-        active_style = Style(color=tc("tag-color", "#00ff00"), bold=True)
+        st = _modal_styles(self.app)
+        sel_style = st.sel
+        dim_style = st.dim
+        active_style = st.tag
 
         text = Text()
         for i, name in enumerate(THEME_NAMES):
@@ -2627,7 +3324,7 @@ class ThemeModal(ModalScreen[str]):
                 self.cur -= 1
                 self._refresh_display()
                 self._preview_current()
-        elif key in ("enter", "return"):
+        elif key in _ENTER_KEYS:
             self.dismiss(THEME_NAMES[self.cur])
         elif key == "escape":
             # Restore original theme
@@ -2663,6 +3360,10 @@ class ProfilesModal(ModalScreen[str]):
         self.active_name = active_name
         self._delete_pending = False
         self.cur = 0
+        self._profiles: List[dict] = []
+        self._rows_key = None
+        self._rows_normal: list = []
+        self._hints_mode = None
 
     def compose(self) -> ComposeResult:
         with Vertical(id="profiles-box"):
@@ -2671,61 +3372,81 @@ class ProfilesModal(ModalScreen[str]):
             yield Static(id="profiles-hints")
 
     def on_mount(self):
-        tc = lambda role, fb="": _tc(self.app, role, fb)
-        title = Text("Profiles", style=Style(color=tc("header-color", "#00ffff"), bold=True))
+        # Load once for the modal's lifetime — every mutation (new, edit,
+        # delete, activate) dismisses this screen, so navigation keys
+        # never need to re-stat the profiles file
+        self._profiles = self.mgr.load_profiles()
+        title = Text("Profiles", style=_tstyle(self.app, "header-color", "#00ffff", bold=True))
         self.query_one("#profiles-title", Static).update(title)
         self._refresh_display()
 
     def _get_profiles(self):
-        return self.mgr.load_profiles()
+        return self._profiles
 
     def _refresh_display(self):
-        tc = lambda role, fb="": _tc(self.app, role, fb)
-        sel_style = Style(color=tc("header-color", "#00ffff"), bold=True, reverse=True)
-        dim_style = Style(color=tc("dim-color", "#888888"))
-        tag_style = Style(color=tc("tag-color", "#00ff00"), bold=True)
-        badge_style = Style(color=tc("badge-fg", "#000000"), bgcolor=tc("badge-bg", "#00aa00"), bold=True)
-        warn_style = Style(color=tc("warn-color", "#ff4444"), bold=True)
+        st = _modal_styles(self.app)
+        sel_style = st.sel
+        dim_style = st.dim
+        tag_style = st.tag
+        badge_style = st.badge
+        warn_style = st.warn
 
         profiles = self._get_profiles()
-        text = Text()
-        if not profiles:
-            text.append("No profiles yet.\n", style=dim_style)
-            text.append("Press n to create your first profile.", style=dim_style)
-        else:
-            for i, p in enumerate(profiles):
+        # Cache the non-selected rendering of every row so cursor moves
+        # only rebuild the one row that gained the selection bar
+        rows_key = (id(profiles), self.active_name,
+                    getattr(self.app, "_ccs_theme_name", ""))
+        if rows_key != self._rows_key:
+            self._rows_key = rows_key
+            self._rows_normal = []
+            for p in profiles:
                 name = p.get("name", "?")
                 summary = profile_summary(p)
-                is_active = (name == self.active_name)
-                is_sel = (i == self.cur)
-
-                prefix = " \u25b8 " if is_sel else "   "
-                marker = " * " if is_active else "   "
-                line = f"{prefix}{marker}{name:<16s} {summary}"
-
-                if is_sel:
-                    text.append(line, style=sel_style)
+                if name == self.active_name:
+                    self._rows_normal.append((
+                        "   ", (" * ", badge_style),
+                        (f"{name:<16s} ", tag_style), (summary, dim_style),
+                    ))
                 else:
-                    text.append(prefix)
-                    if is_active:
-                        text.append(marker, style=badge_style)
-                    else:
-                        text.append(marker)
-                    text.append(f"{name:<16s} ", style=tag_style)
-                    text.append(summary, style=dim_style)
-                if i < len(profiles) - 1:
-                    text.append("\n")
-
-        self.query_one("#profiles-list-text", Static).update(text)
+                    self._rows_normal.append((
+                        (f"      {name:<16s} ", tag_style),
+                        (summary, dim_style),
+                    ))
+
+        # Collect (text, style) parts and assemble once, two or three
+        # parts per row instead of growing the Text append by append
+        parts: list = []
+        if not profiles:
+            parts.append(("No profiles yet.\n", dim_style))
+            parts.append(("Press n to create your first profile.", dim_style))
+        else:
+            last = len(profiles) - 1
+            for i, p in enumerate(profiles):
+                if i == self.cur:
+                    name = p.get("name", "?")
+                    is_active = (name == self.active_name)
+                    parts.append((f" \u25b8 {' * ' if is_active else '   '}"
+                                  f"{name:<16s} {profile_summary(p)}", sel_style))
+                else:
+                    parts.extend(self._rows_normal[i])
+                if i < last:
+                    parts.append("\n")
+        text = Text.assemble(*parts)
 
-        # Hints
+        # Hints \u2014 repaint only when the mode actually flips
         if self._delete_pending:
             pname = profiles[self.cur].get("name", "?") if profiles and self.cur < len(profiles) else "?"
+            hints_mode = ("delete", pname)
             hints = Text(f"Delete '{pname}'? y/N", style=warn_style, justify="center")
         else:
+            hints_mode = "nav"
             hints = Text("\u23ce Set active  n New  e Edit  d Delete  Esc Back",
                          style=dim_style, justify="center")
-        self.query_one("#profiles-hints", Static).update(hints)
+        with self.app.batch_update():
+            self.query_one("#profiles-list-text", Static).update(text)
+            if hints_mode != self._hints_mode:
+                self._hints_mode = hints_mode
+                self.query_one("#profiles-hints", Static).update(hints)
 
     def _get_selected_name(self) -> str:
         profiles = self._get_profiles()
@@ -2764,18 +3485,19 @@ class ProfilesModal(ModalScreen[str]):
         event.prevent_default()
         profiles = self._get_profiles()
         n = len(profiles)
+        # Bind the selected name once — every action branch needs it
+        name = self._get_selected_name()
 
         if self._delete_pending:
-            if key in ("y", "Y"):
-                name = self._get_selected_name()
+            if key in _YES_KEYS:
                 if name:
                     self.dismiss(f"delete:{name}")
-            elif key in ("n", "N", "escape"):
+            elif key in _NO_KEYS:
                 self._delete_pending = False
                 self._refresh_display()
             return
 
-        if key in ("escape",):
+        if key == "escape":
             self.dismiss(None)
         elif key == "down":
             if self.cur < n - 1:
@@ -2785,18 +3507,15 @@ class ProfilesModal(ModalScreen[str]):
             if self.cur > 0:
                 self.cur -= 1
                 self._refresh_display()
-        elif key in ("enter", "return"):
-            name = self._get_selected_name()
+        elif key in _ENTER_KEYS:
             if name:
                 self.dismiss(f"activate:{name}")
         elif key == "n":
             self.dismiss("new")
         elif key == "e":
-            name = self._get_selected_name()
             if name:
                 self.dismiss(f"edit:{name}")
         elif key == "d":
-            name = self._get_selected_name()
             if name and name.lower() != "default":
                 self._delete_pending = True
                 self._refresh_display()
@@ -2831,22 +3550,10 @@ class ProfileEditModal(ModalScreen[dict]):
         self.expert_mode = bool(profile.get("expert_args", "").strip()) if profile else False
         if profile:
             self.prof_name = profile.get("name", "")
-            self.model_idx = 0
-            model = profile.get("model", "")
-            for i, (_, mid) in enumerate(MODELS):
-                if mid == model:
-                    self.model_idx = i
-                    break
-            self.perm_idx = 0
-            perm = profile.get("permission_mode", "")
-            for i, (_, pid) in enumerate(PERMISSION_MODES):
-                if pid == perm:
-                    self.perm_idx = i
-                    break
-            self.toggles = [False] * len(TOGGLE_FLAGS)
-            flags = profile.get("flags", [])
-            for i, (_, cli_flag) in enumerate(TOGGLE_FLAGS):
-                self.toggles[i] = cli_flag in flags
+            self.model_idx = MODEL_IDX.get(profile.get("model", ""), 0)
+            self.perm_idx = PERM_IDX.get(profile.get("permission_mode", ""), 0)
+            flags = set(profile.get("flags", []))
+            self.toggles = [cli_flag in flags for _, cli_flag in TOGGLE_FLAGS]
             self.sysprompt = profile.get("system_prompt", "")
             self.tools_val = profile.get("tools", "")
             self.mcp_val = profile.get("mcp_config", "")
@@ -2867,6 +3574,12 @@ class ProfileEditModal(ModalScreen[dict]):
         self.rows = build_profile_edit_rows(self.expert_mode)
         self.cur = 0
         self._editing_field = None
+        self._hints_mode = None
+        # Rendered-line cache: bump _edit_version on any value change so
+        # cursor-only moves reuse every row except the one gaining the bar
+        self._edit_version = 0
+        self._row_cache_key = None
+        self._row_lines: dict = {}
 
     def compose(self) -> ComposeResult:
         with Vertical(id="profedit-box"):
@@ -2884,30 +3597,45 @@ class ProfileEditModal(ModalScreen[dict]):
         self._edit_text_field(ROW_PROF_NAME)
 
     def _update_title(self):
-        tc = lambda role, fb="": _tc(self.app, role, fb)
         is_new = self.editing_profile is None
         mode_label = "Expert" if self.expert_mode else "Structured"
         title = Text(f"{'New' if is_new else 'Edit'} Profile ({mode_label})",
-                     style=Style(color=tc("header-color", "#00ffff"), bold=True))
+                     style=_tstyle(self.app, "header-color", "#00ffff", bold=True))
         self.query_one("#profedit-title", Static).update(title)
 
     def _refresh_display(self):
-        self.rows = build_profile_edit_rows(self.expert_mode)
-        if self.cur >= len(self.rows):
-            self.cur = max(0, len(self.rows) - 1)
+        rows = self.rows = build_profile_edit_rows(self.expert_mode)
+        if self.cur >= len(rows):
+            self.cur = max(0, len(rows) - 1)
 
-        tc = lambda role, fb="": _tc(self.app, role, fb)
-        sel_style = Style(color=tc("header-color", "#00ffff"), bold=True, reverse=True)
-        dim_style = Style(color=tc("dim-color", "#888888"))
-        tag_style = Style(color=tc("tag-color", "#00ff00"), bold=True)
-        save_style = Style(color=tc("status-color", "#00ff00"), bold=True)
+        st = _modal_styles(self.app)
+        sel_style = st.sel
+        dim_style = st.dim
+        tag_style = st.tag
+        save_style = st.status
 
         def cb(val):
             return "[x]" if val else "[ ]"
 
+        cache_key = (self._edit_version, self.expert_mode,
+                     getattr(self.app, "_ccs_theme_name", ""))
+        if cache_key != self._row_cache_key:
+            self._row_cache_key = cache_key
+            self._row_lines.clear()
+        row_lines = self._row_lines
+
         text = Text()
-        for ri, (rtype, ridx) in enumerate(self.rows):
-            is_sel = (ri == self.cur)
+        cur = self.cur
+        last = len(rows) - 1
+        for ri, (rtype, ridx) in enumerate(rows):
+            is_sel = (ri == cur)
+            if not is_sel:
+                cached = row_lines.get((rtype, ridx))
+                if cached is not None:
+                    text.append(cached[0], style=cached[1])
+                    if ri < last:
+                        text.append("\n")
+                    continue
             prefix = " \u25b8 " if is_sel else "   "
             line = ""
             line_style = sel_style if is_sel else None
@@ -2921,12 +3649,11 @@ class ProfileEditModal(ModalScreen[dict]):
             elif rtype == ROW_EXPERT:
                 line = f"{prefix}claude {self.expert_args or '(enter args)'}"
             elif rtype == ROW_MODEL:
-                line = f"{prefix}Model:       {MODELS[self.model_idx][0]}"
+                line = f"{prefix}Model:       {MODEL_LABELS[self.model_idx]}"
             elif rtype == ROW_PERMMODE:
-                line = f"{prefix}Permissions: {PERMISSION_MODES[self.perm_idx][0]}"
+                line = f"{prefix}Permissions: {PERM_LABELS[self.perm_idx]}"
             elif rtype == ROW_TOGGLE:
-                flag_name = TOGGLE_FLAGS[ridx][0]
-                line = f"{prefix}{flag_name:<38s} {cb(self.toggles[ridx])}"
+                line = f"{prefix}{_TOGGLE_PREFIXES[ridx]}{cb(self.toggles[ridx])}"
             elif rtype == ROW_SYSPROMPT:
                 v = self.sysprompt[:40] + ("..." if len(self.sysprompt) > 40 else "")
                 line = f"{prefix}System prompt: {v or '(none)'}"
@@ -2944,19 +3671,24 @@ class ProfileEditModal(ModalScreen[dict]):
                 if not is_sel:
                     line_style = save_style
 
-            text.append(line, style=line_style or dim_style)
-            if ri < len(self.rows) - 1:
+            style = line_style or dim_style
+            if not is_sel:
+                row_lines[(rtype, ridx)] = (line, style)
+            text.append(line, style=style)
+            if ri < last:
                 text.append("\n")
 
-        self.query_one("#profedit-rows-text", Static).update(text)
-
-        # Hints
-        if self.expert_mode:
-            hints_str = "Tab structured \u00b7 \u23ce edit/save \u00b7 Esc cancel"
-        else:
-            hints_str = "Tab expert \u00b7 Space toggle \u00b7 \u23ce edit/save \u00b7 Esc cancel"
-        hints = Text(hints_str, style=dim_style, justify="center")
-        self.query_one("#profedit-hints", Static).update(hints)
+        # Hints \u2014 only change when the editor mode flips
+        with self.app.batch_update():
+            self.query_one("#profedit-rows-text", Static).update(text)
+            if self.expert_mode != self._hints_mode:
+                self._hints_mode = self.expert_mode
+                if self.expert_mode:
+                    hints_str = "Tab structured \u00b7 \u23ce edit/save \u00b7 Esc cancel"
+                else:
+                    hints_str = "Tab expert \u00b7 Space toggle \u00b7 \u23ce edit/save \u00b7 Esc cancel"
+                hints = Text(hints_str, style=dim_style, justify="center")
+                self.query_one("#profedit-hints", Static).update(hints)
 
     def _to_profile_dict(self) -> dict:
         name = self.prof_name.strip()
@@ -2981,31 +3713,25 @@ class ProfileEditModal(ModalScreen[dict]):
             "tmux": self.use_tmux,
         }
 
+    # Text-field row type → backing attribute, shared by get/set
+    _FIELD_ATTRS = {
+        ROW_PROF_NAME: "prof_name",
+        ROW_EXPERT: "expert_args",
+        ROW_SYSPROMPT: "sysprompt",
+        ROW_TOOLS: "tools_val",
+        ROW_MCP: "mcp_val",
+        ROW_CUSTOM: "custom_val",
+    }
+
     def _get_field_value(self, rtype: str) -> str:
-        mapping = {
-            ROW_PROF_NAME: lambda: self.prof_name,
-            ROW_EXPERT: lambda: self.expert_args,
-            ROW_SYSPROMPT: lambda: self.sysprompt,
-            ROW_TOOLS: lambda: self.tools_val,
-            ROW_MCP: lambda: self.mcp_val,
-            ROW_CUSTOM: lambda: self.custom_val,
-        }
-        getter = mapping.get(rtype)
-        return getter() if getter else ""
+        attr = self._FIELD_ATTRS.get(rtype)
+        return getattr(self, attr) if attr else ""
 
     def _set_field_value(self, rtype: str, val: str):
-        if rtype == ROW_PROF_NAME:
-            self.prof_name = val
-        elif rtype == ROW_EXPERT:
-            self.expert_args = val
-        elif rtype == ROW_SYSPROMPT:
-            self.sysprompt = val
-        elif rtype == ROW_TOOLS:
-            self.tools_val = val
-        elif rtype == ROW_MCP:
-            self.mcp_val = val
-        elif rtype == ROW_CUSTOM:
-            self.custom_val = val
+        attr = self._FIELD_ATTRS.get(rtype)
+        if attr:
+            self._edit_version += 1
+            setattr(self, attr, val)
 
     def _edit_text_field(self, rtype: str):
         labels = {
@@ -3029,6 +3755,7 @@ class ProfileEditModal(ModalScreen[dict]):
         self.app.push_screen(SimpleInputModal(title, current), on_result)
 
     def _toggle_current(self, rtype, ridx):
+        self._edit_version += 1
         if rtype == ROW_MODEL:
             self.model_idx = (self.model_idx + 1) % len(MODELS)
         elif rtype == ROW_PERMMODE:
@@ -3097,10 +3824,14 @@ class ProfileEditModal(ModalScreen[dict]):
             if self.cur > 0:
                 self.cur -= 1
                 self._refresh_display()
-        elif key in ("enter", "return", "space"):
+        elif key in _ENTER_KEYS or key == "space":
             self._activate_current()
 
 
+# Prebuilt separator line for ContextMenuModal (matches the 38-wide box)
+_CTX_SEP_LINE = "  " + "─" * 34
+
+
 class ContextMenuModal(ModalScreen[str]):
     """Context menu with clickable items and separator support.
 
@@ -3157,23 +3888,30 @@ class ContextMenuModal(ModalScreen[str]):
         accent = tc("accent-color", "#00cccc")
         box = self.query_one("#ctx-menu-box")
         box.styles.border = ("heavy", accent)
-        title = Text(self.title_text, style=Style(color=tc("header-color", "#00ffff"), bold=True))
+        title = Text(self.title_text, style=_tstyle(self.app, "header-color", "#00ffff", bold=True))
         self.query_one("#ctx-menu-title", Static).update(title)
+        # Separator rows never change \u2014 compose them once here instead of
+        # on every cursor move
+        sep = Text(_CTX_SEP_LINE, style=_tstyle(self.app, "dim-color", "#555555"))
+        for i, (_label, key) in enumerate(self.items):
+            if key == "---":
+                self.query_one(f"#ctx-item-{i}", Static).update(sep)
         self._refresh_display()
 
+    def _render_item(self, i):
+        label, key = self.items[i]
+        if key == "---":
+            return
+        st = _modal_styles(self.app)
+        widget = self.query_one(f"#ctx-item-{i}", Static)
+        if i == self.cur:
+            widget.update(Text(f" > {label}", style=st.sel))
+        else:
+            widget.update(Text(f"   {label}", style=st.dim))
+
     def _refresh_display(self):
-        tc = lambda role, fb="": _tc(self.app, role, fb)
-        sel_color = tc("header-color", "#00ffff")
-        dim_color = tc("dim-color", "#888888")
-        sep_color = tc("dim-color", "#555555")
-        for i, (label, key) in enumerate(self.items):
-            widget = self.query_one(f"#ctx-item-{i}", Static)
-            if key == "---":
-                widget.update(Text("  " + "\u2500" * 34, style=Style(color=sep_color)))
-            elif i == self.cur:
-                widget.update(Text(f" > {label}", style=Style(color=sel_color, bold=True, reverse=True)))
-            else:
-                widget.update(Text(f"   {label}", style=Style(color=dim_color)))
+        for i in range(len(self.items)):
+            self._render_item(i)
 
     def on_click(self, event):
         """Handle clicks on menu items."""
@@ -3202,8 +3940,11 @@ class ContextMenuModal(ModalScreen[str]):
         while 0 <= new < n and self._is_separator(new):
             new += direction
         if 0 <= new < n:
+            old = self.cur
             self.cur = new
-            self._refresh_display()
+            # Only the rows losing and gaining the cursor change
+            self._render_item(old)
+            self._render_item(new)
 
     def on_key(self, event):
         key = event.key
@@ -3215,7 +3956,7 @@ class ContextMenuModal(ModalScreen[str]):
             self._move_cursor(-1)
         elif key == "down":
             self._move_cursor(1)
-        elif key in ("enter", "return"):
+        elif key in _ENTER_KEYS:
             if not self._is_separator(self.cur):
                 self.dismiss(self.items[self.cur][1])
 
@@ -3241,6 +3982,7 @@ class CCSApp(App):
         self.mgr.purge_ephemeral()
         self.sessions = []
         self.filtered = []
+        self._sessions_by_id = {}
         self.search_query = ""
         self.sort_mode = "date"
         self.marked = set()
@@ -3263,14 +4005,95 @@ class CCSApp(App):
         self.tmux_pane_ts = {}
         self.tmux_claude_state = {}
         self._git_cache = {}
+        self._git_disk_cache = self.mgr._load(GIT_CACHE_FILE, {})
 
         self.detail_focus = "info"
         self.exit_action = None
-        self._status_timer = None
+        self._status_expire = 0.0
+        self._columns_hdr = None
+        self._preview_timer = None
+        # Launch-args cache: hold the profiles list itself (an id() of a
+        # freed list can be reused) plus the active name it was built for
+        self._launch_src = None
+        self._launch_name = None
+        self._launch_val = ([], True)
+
+        # Static key → handler tables, built once instead of walking an
+        # if/elif chain (and the menu's action dict) per keystroke
+        self._keys_global = {
+            "ctrl+c": self.action_quit_confirm,
+            "question_mark": self.action_help,
+            "?": self.action_help,
+            "P": self.action_profiles,
+            "H": self.action_cycle_theme,
+            "m": self._show_action_menu,
+            "r": self.action_refresh,
+            "f5": self.action_refresh,
+            "S": self.action_rescan,
+            "escape": self.action_escape_action,
+        }
+        self._keys_detail = {
+            "tab": self.action_switch_pane,
+            "enter": self.action_launch,
+            "p": self.action_toggle_pin,
+            "t": self.action_set_tag,
+            "T": self.action_remove_tag,
+            "d": self.action_delete_session,
+            "k": self.action_kill_tmux,
+            "i": self.action_send_input,
+        }
+        self._keys_sessions = {
+            "enter": self.action_launch,
+            "space": self.action_mark,
+            "u": self.action_unmark_all,
+            "p": self.action_toggle_pin,
+            "t": self.action_set_tag,
+            "T": self.action_remove_tag,
+            "d": self.action_delete_session,
+            "D": self.action_delete_empty,
+            "C": self.action_toggle_continuations,
+            "k": self.action_kill_tmux,
+            "K": self.action_kill_all_tmux,
+            "n": self.action_new_session,
+            "e": self.action_ephemeral_session,
+            "s": self.action_cycle_sort,
+            "i": self.action_send_input,
+            "slash": self.action_search,
+        }
+        self._menu_actions = {
+            "launch": self.action_launch,
+            "tmux_expert": self._action_tmux_expert,
+            "back": self._switch_to_sessions,
+            "switch_pane": self.action_switch_pane,
+            "view": self._switch_to_detail,
+            "new": self.action_new_session,
+            "ephemeral": self.action_ephemeral_session,
+            "mark": self.action_mark,
+            "unmark": self.action_unmark_all,
+            "pin": self.action_toggle_pin,
+            "tag": self.action_set_tag,
+            "remove_tag": self.action_remove_tag,
+            "delete": self.action_delete_session,
+            "delete_empty": self.action_delete_empty,
+            "toggle_cont": self.action_toggle_continuations,
+            "archive_cont": self.action_archive_continuations,
+            "kill_tmux": self.action_kill_tmux,
+            "kill_all_tmux": self.action_kill_all_tmux,
+            "send_input": self.action_send_input,
+            "sort": self.action_cycle_sort,
+            "search": self.action_search,
+            "refresh": self.action_refresh,
+            "rescan": self.action_rescan,
+            "theme": self.action_cycle_theme,
+            "profiles": self.action_profiles,
+            "help": self.action_help,
+            "exit": self.action_quit_confirm,
+        }
         self._last_click_time = 0.0
         self._last_click_idx = -1
         self._last_preview_click = 0.0
         self.show_continuations = False
+        self._now_ts = 0.0  # per-frame clock, refreshed before renders
 
     def compose(self) -> ComposeResult:
         with Container(id="header"):
@@ -3295,12 +4118,23 @@ class CCSApp(App):
         yield FooterBar(id="footer")
 
     def on_mount(self):
+        # Cache widget handles once — the per-tick update paths below run
+        # several times a second and query_one is a DOM walk each call
+        self._w_list = self.query_one("#session-list", SessionListWidget)
+        self._w_columns = self.query_one("#session-columns", Static)
+        self._w_preview = self.query_one("#preview", PreviewPane)
+        self._w_info = self.query_one("#info-pane", InfoPane)
+        self._w_tmux = self.query_one("#tmux-pane", TmuxPane)
+        self._w_header = self.query_one("#header-content", HeaderBox)
+        self._w_footer = self.query_one("#footer", FooterBar)
+
         # Initial data load
         self._do_refresh()
 
         # Timers
         self.set_interval(TMUX_POLL_INTERVAL, self._poll_tmux_activity)
         self.set_interval(TMUX_CAPTURE_INTERVAL, self._poll_tmux_capture)
+        self.set_interval(1.0, self._tick_status)
 
         # Startup warnings
         warnings = []
@@ -3315,13 +4149,36 @@ class CCSApp(App):
         self._update_header()
 
         # Focus session list for key routing
-        self.query_one("#session-list", SessionListWidget).focus()
+        self._w_list.focus()
 
     # -- Data management ---------------------------------------------------
 
+    def _refresh_in_place(self):
+        """Re-sort the cached list and repaint without rescanning disk.
+
+        For metadata-only mutations (pin, tag) the Session objects are
+        patched in memory, so scan()'s directory walk adds nothing."""
+        if self.sort_mode == "tmux":
+            sids = self.tmux_sids
+            self.sessions.sort(
+                key=lambda s: (
+                    0 if s.pinned else 1,
+                    0 if s.id in sids else 1,
+                    -s.mtime,
+                )
+            )
+        else:
+            self.sessions.sort(key=lambda s: s.get_sort_key(self.sort_mode))
+        self._apply_filter()
+        with self.batch_update():
+            self._rebuild_list()
+            self._update_preview()
+            self._update_header()
+
     def _do_refresh(self, force=False):
         """Refresh session data and rebuild UI."""
         self.sessions = self.mgr.scan(self.sort_mode, force=force)
+        self._sessions_by_id = {s.id: s for s in self.sessions}
         SessionManager.build_continuation_chains(self.sessions)
         if HAS_TMUX:
             self.tmux_sids = self.mgr.tmux_alive_sids()
@@ -3346,25 +4203,35 @@ class CCSApp(App):
             self.tmux_pane_ts.pop(sid, None)
             self.tmux_claude_state.pop(sid, None)
         self.tmux_last_poll = 0
-        self._rebuild_list()
-        self._update_preview()
-        self._update_header()
+        # Batch so the list, preview and header repaint in one screen
+        # update instead of three
+        with self.batch_update():
+            self._rebuild_list()
+            self._update_preview()
+            self._update_header()
 
-        valid_ids = {s.id for s in self.filtered}
-        self.marked &= valid_ids
+        # Drop marks on sessions that vanished — but marks are rare, so
+        # don't build the id set at all when none exist
+        if self.marked:
+            self.marked &= {s.id for s in self.filtered}
 
     def _apply_filter(self):
         q = self.search_query.lower()
         if not q:
             self.filtered = list(self.sessions)
         else:
-            self.filtered = [
-                s for s in self.sessions
-                if q in (s.tag or "").lower()
-                or q in (s.label or "").lower()
-                or q in s.project_display.lower()
-                or q in s.id.lower()
-            ]
+            # Whitespace splits the query into AND-ed terms, so
+            # "api mywork" finds a tagged session about the API no matter
+            # which field each term lives in. str.find beats a compiled
+            # regex for plain substring terms.
+            terms = q.split()
+            if len(terms) > 1:
+                self.filtered = [
+                    s for s in self.sessions
+                    if all(t in s.search_blob for t in terms)
+                ]
+            else:
+                self.filtered = [s for s in self.sessions if q in s.search_blob]
         # Hide chain members unless toggled on (search always shows all)
         if not self.show_continuations and not q:
             self.filtered = [s for s in self.filtered if not s.hide_when_collapsed]
@@ -3387,7 +4254,8 @@ class CCSApp(App):
             self.filtered = result
 
     def _rebuild_list(self):
-        sl = self.query_one("#session-list", SessionListWidget)
+        self._now_ts = time.time()
+        sl = self._w_list
         # Preserve current selection across rebuild
         prev_id = None
         if sl.highlighted is not None and sl.highlighted < len(self.filtered):
@@ -3399,6 +4267,7 @@ class CCSApp(App):
                 prev_id = opt.id
             except Exception:
                 pass
+        max_tag_w = _tag_col_width(self.filtered)
         sl.rebuild(
             self.filtered,
             self.tmux_sids,
@@ -3406,21 +4275,15 @@ class CCSApp(App):
             self.tmux_claude_state,
             self.marked,
             self.show_continuations,
+            tag_col_w=max_tag_w,
         )
-        # Update column header
-        max_tag_w = 0
-        for s in self.filtered:
-            if s.tag:
-                tw = min(len(s.tag), 8) + 3
-                if len(s.tag) > 8:
-                    tw = 14
-                if tw > max_tag_w:
-                    max_tag_w = tw
+        # Update column header — identical text is the common case, and
+        # Static.update repaints even when nothing changed
         tag_hdr = f"{'Tag':<{max_tag_w}}" if max_tag_w else ""
         hdr = f"         {tag_hdr}{'Modified':<18s}{'Msgs':<6s}{'Project':<25s}Description"
-        self.query_one("#session-columns", Static).update(
-            Text(hdr, style=Style(dim=True))
-        )
+        if hdr != self._columns_hdr:
+            self._columns_hdr = hdr
+            self._w_columns.update(Text(hdr, style=Style(dim=True)))
         # Restore selection
         if prev_id is not None:
             for i, s in enumerate(self.filtered):
@@ -3436,8 +4299,9 @@ class CCSApp(App):
         self._update_footer()
 
     def _update_preview(self):
+        self._now_ts = time.time()
         s = self._current_session()
-        preview = self.query_one("#preview", PreviewPane)
+        preview = self._w_preview
         preview.update_preview(
             s,
             self.mgr,
@@ -3448,6 +4312,7 @@ class CCSApp(App):
         )
 
     def _update_detail(self):
+        self._now_ts = time.time()
         s = self._current_session()
         if s is None:
             return
@@ -3455,7 +4320,7 @@ class CCSApp(App):
         proj_path = os.path.expanduser(s.project_display) if s.project_display else ""
         if proj_path and os.path.isdir(proj_path) and proj_path not in self._git_cache:
             self._get_git_info(proj_path)
-        info = self.query_one("#info-pane", InfoPane)
+        info = self._w_info
         info.update_info(
             s,
             self.mgr,
@@ -3466,7 +4331,7 @@ class CCSApp(App):
             self.tmux_pane_cache,
         )
         # Update tmux pane
-        tmux_pane = self.query_one("#tmux-pane", TmuxPane)
+        tmux_pane = self._w_tmux
         if s.id in self.tmux_sids:
             raw_lines = self.tmux_pane_cache.get(s.id, [])
             state = self.tmux_claude_state.get(s.id, "unknown")
@@ -3475,86 +4340,102 @@ class CCSApp(App):
             tmux_pane.update_content(None)
 
     def _update_header(self):
-        header = self.query_one("#header-content", HeaderBox)
+        header = self._w_header
         header.view_name = "Session View" if self.view == "detail" else "Sessions"
         header.profile_name = self.active_profile_name
         header.session_count = len(self.filtered)
         header.total_count = len(self.sessions)
         header.sort_mode = self.sort_mode
         header.search_query = self.search_query
-        if self.view == "detail":
-            header.hints = (
-                "\u2190/Esc back \u00b7 \u2191/\u2193 scroll \u00b7 Tab switch panel \u00b7 \u2192/\u23ce resume"
-                " \u00b7 p pin \u00b7 t tag \u00b7 d del \u00b7 m menu"
-            )
-        else:
-            header.hints = (
-                "\u2191/\u2193 nav \u00b7 \u2192 view \u00b7 \u23ce resume \u00b7 p pin \u00b7 t tag"
-                " \u00b7 n new \u00b7 / search \u00b7 s sort \u00b7 m menu \u00b7 ? help"
-            )
+        header.hints = _HINTS_DETAIL if self.view == "detail" else _HINTS_SESSIONS
 
     def _update_footer(self):
-        footer = self.query_one("#footer", FooterBar)
+        footer = self._w_footer
         footer.marked_count = len(self.marked)
-        sl = self.query_one("#session-list", SessionListWidget)
+        sl = self._w_list
         if sl.option_count > 0 and sl.highlighted is not None:
             footer.position = f"{sl.highlighted + 1}/{sl.option_count}"
         else:
             footer.position = ""
 
     def _current_session(self):
-        sl = self.query_one("#session-list", SessionListWidget)
+        sl = self._w_list
         if sl.highlighted is not None and sl.highlighted < len(self.filtered):
             return self.filtered[sl.highlighted]
         return None
 
     def _set_status(self, msg, ttl=5):
-        footer = self.query_one("#footer", FooterBar)
-        footer.status = msg
-        if self._status_timer:
-            self._status_timer.stop()
-        self._status_timer = self.set_timer(ttl, self._clear_status)
+        # Monotonic expiry checked by a single interval — avoids creating
+        # (and cancelling) a Timer object for every status message
+        self._w_footer.status = msg
+        self._status_expire = time.monotonic() + ttl
 
-    def _clear_status(self):
+    def _tick_status(self):
         try:
-            footer = self.query_one("#footer", FooterBar)
-            footer.status = ""
+            if self._w_footer.status and time.monotonic() >= self._status_expire:
+                self._w_footer.status = ""
         except Exception:
             pass
 
     # -- Git info ----------------------------------------------------------
 
+    @staticmethod
+    def _git_head_mtime(cwd):
+        """mtime marking the repo state for cwd, or None outside a repo.
+
+        Prefers .git/logs/HEAD, which is touched by every commit and
+        checkout, over .git/HEAD, which only changes on checkout."""
+        d = cwd
+        while True:
+            g = os.path.join(d, ".git")
+            if os.path.isdir(g):
+                for name in ("logs/HEAD", "HEAD"):
+                    try:
+                        return os.stat(os.path.join(g, name)).st_mtime
+                    except OSError:
+                        continue
+                return None
+            if os.path.exists(g):
+                # gitfile (worktree/submodule) — don't chase indirection
+                return None
+            parent = os.path.dirname(d)
+            if parent == d:
+                return None
+            d = parent
+
     def _get_git_info(self, cwd):
         if not HAS_GIT or not cwd:
             return None
         if cwd in self._git_cache:
             return self._git_cache[cwd]
+        # Persistent cache keyed by HEAD mtime lets later runs skip the
+        # git subprocesses entirely while the repo state is unchanged.
+        head_mt = self._git_head_mtime(cwd)
+        ent = self._git_disk_cache.get(cwd)
+        if head_mt is not None and ent and ent.get("head") == head_mt:
+            info = ent.get("info")
+            result = (info[0], info[1], [tuple(c) for c in info[2]]) if info else None
+            self._git_cache[cwd] = result
+            return result
         try:
+            # One rev-parse answers toplevel and branch together; git
+            # prints whatever it resolved even if a later arg fails (e.g.
+            # no HEAD yet in a fresh repo), so parse stdout by line.
             r = subprocess.run(
-                ["git", "-C", cwd, "rev-parse", "--show-toplevel"],
+                ["git", "-C", cwd, "rev-parse", "--show-toplevel", "--abbrev-ref", "HEAD"],
                 capture_output=True,
                 text=True,
                 timeout=2,
             )
-            if r.returncode != 0:
+            lines = r.stdout.strip().splitlines()
+            if not lines or not lines[0].strip():
                 self._git_cache[cwd] = None
                 return None
-            repo_name = os.path.basename(r.stdout.strip())
+            repo_name = os.path.basename(lines[0].strip())
+            branch = lines[1].strip() if len(lines) > 1 else ""
         except Exception:
             self._git_cache[cwd] = None
             return None
-        branch = ""
-        try:
-            r = subprocess.run(
-                ["git", "-C", cwd, "rev-parse", "--abbrev-ref", "HEAD"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if r.returncode == 0:
-                branch = r.stdout.strip()
-        except Exception:
-            pass
         commits = []
         try:
             r = subprocess.run(
@@ -3573,6 +4454,15 @@ class CCSApp(App):
             pass
         result = (repo_name, branch, commits)
         self._git_cache[cwd] = result
+        if head_mt is not None:
+            self._git_disk_cache[cwd] = {
+                "head": head_mt,
+                "info": [repo_name, branch, commits],
+            }
+            try:
+                self.mgr._save(GIT_CACHE_FILE, self._git_disk_cache)
+            except Exception:
+                pass
         return result
 
     # -- Tmux polling ------------------------------------------------------
@@ -3607,12 +4497,26 @@ class CCSApp(App):
         if not HAS_TMUX:
             self.tmux_idle = set()
             return
-        # Refresh tmux_sids from live tmux sessions
+        # Run the tmux subprocess on a worker thread so a slow/hung tmux
+        # server never blocks the UI loop; results are applied back on
+        # the main thread. exclusive=True drops a poll that is still in
+        # flight when the next tick fires.
+        self.run_worker(
+            self._tmux_activity_worker,
+            group="tmux-activity",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _tmux_activity_worker(self):
+        # A single list-sessions call answers both liveness and activity
+        activity = self.mgr.tmux_sessions_activity()
+        self.call_from_thread(self._apply_tmux_activity, activity)
+
+    def _apply_tmux_activity(self, activity):
         old_sids = set(self.tmux_sids)
-        try:
-            self.tmux_sids = self.mgr.tmux_alive_sids()
-        except Exception:
-            pass
+        if activity is not None:
+            self.tmux_sids = set(activity)
         new_sids = set(self.tmux_sids)
         sids_changed = (old_sids != new_sids)
         # Prune stale pane cache and auto-delete ephemeral sessions
@@ -3630,49 +4534,24 @@ class CCSApp(App):
                 self._rebuild_list()
                 self._update_footer()
             return
-        try:
-            r = subprocess.run(
-                [
-                    "tmux",
-                    "list-sessions",
-                    "-F",
-                    "#{session_name} #{session_activity}",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if r.returncode != 0:
-                if sids_changed:
-                    self._rebuild_list()
-                    self._update_footer()
-                return
-        except Exception:
+        if activity is None:
+            # tmux couldn't be queried — keep idle state as-is
             if sids_changed:
                 self._rebuild_list()
                 self._update_footer()
             return
         now = time.time()
-        activity = {}
-        for line in r.stdout.strip().splitlines():
-            parts = line.rsplit(" ", 1)
-            if len(parts) == 2:
-                try:
-                    activity[parts[0]] = float(parts[1])
-                except ValueError:
-                    pass
         self.tmux_idle_prev = self.tmux_idle.copy()
         new_idle = set()
         for sid in self.tmux_sids:
-            tmux_name = TMUX_PREFIX + sid
-            ts = activity.get(tmux_name)
+            ts = activity.get(sid)
             if ts is not None and (now - ts) > TMUX_IDLE_SECS:
                 new_idle.add(sid)
         newly_idle = new_idle - self.tmux_idle_prev
         if newly_idle:
             names = []
             for sid in newly_idle:
-                s = next((s for s in self.sessions if s.id == sid), None)
+                s = self._sessions_by_id.get(sid)
                 names.append(s.tag or s.id[:12] if s else sid[:12])
             self._set_status(f"Idle: {', '.join(names)}")
         idle_changed = (self.tmux_idle != new_idle)
@@ -3688,20 +4567,26 @@ class CCSApp(App):
             return
         now = time.monotonic()
         old_states = dict(self.tmux_claude_state)
+        panes_changed = False
         for sid in self.tmux_sids:
             last = self.tmux_pane_ts.get(sid, 0.0)
             if now - last < TMUX_CAPTURE_INTERVAL:
                 continue
-            self._capture_one_pane(sid, TMUX_PREFIX + sid)
+            if self._capture_one_pane(sid, TMUX_PREFIX + sid):
+                panes_changed = True
         # Rebuild session list if any claude state changed
-        if self.tmux_claude_state != old_states:
+        states_changed = (self.tmux_claude_state != old_states)
+        if states_changed:
             self._rebuild_list()
             self._update_footer()
-        # If in detail view, update tmux pane widget
-        if self.view == "detail":
+        # If in detail view, update the pane widgets — but only when a
+        # capture actually produced new content; this poll fires several
+        # times a second and idle panes are the common case.
+        if self.view == "detail" and (panes_changed or states_changed):
             self._update_detail()
 
-    def _capture_one_pane(self, sid, tmux_name):
+    def _capture_one_pane(self, sid, tmux_name) -> bool:
+        """Capture one pane; return True if its content changed."""
         try:
             # Capture WITH ANSI preserved (-e flag) for rendering
             r = subprocess.run(
@@ -3711,20 +4596,23 @@ class CCSApp(App):
                 timeout=2,
             )
             if r.returncode != 0:
-                return
+                return False
             raw_lines = r.stdout.splitlines()
             # Trim trailing empty lines
             while raw_lines and not raw_lines[-1].strip():
                 raw_lines.pop()
             raw_lines = raw_lines[-TMUX_CAPTURE_LINES:]
+            changed = (raw_lines != self.tmux_pane_cache.get(sid))
             self.tmux_pane_cache[sid] = raw_lines
             self.tmux_pane_ts[sid] = time.monotonic()
-            # Strip ANSI for state detection
-            stripped = [strip_ansi(ln) for ln in raw_lines]
-            self.tmux_pane_cache_stripped[sid] = stripped
-            self._detect_claude_state(sid, stripped)
+            if changed:
+                # Strip ANSI for state detection
+                stripped = [strip_ansi(ln) for ln in raw_lines]
+                self.tmux_pane_cache_stripped[sid] = stripped
+                self._detect_claude_state(sid, stripped)
+            return changed
         except Exception:
-            pass
+            return False
 
     def _detect_claude_state(self, sid, lines):
         if not lines:
@@ -3779,7 +4667,9 @@ class CCSApp(App):
 
     def _tmux_launch(self, s, extra, env_vars=""):
         tmux_name = TMUX_PREFIX + s.id
-        if s.id in self.mgr.tmux_alive_sids():
+        # self.tmux_sids is kept fresh by the activity poll; no need for
+        # another list-sessions subprocess on the launch path
+        if s.id in self.tmux_sids:
             if env_vars:
                 # Kill existing session so we can restart with new env vars
                 subprocess.run(
@@ -3813,9 +4703,11 @@ class CCSApp(App):
         if proj_dir and os.path.isdir(proj_dir):
             cmd_str = f"cd {shlex.quote(proj_dir)} && {cmd_str}"
         full_cmd = self._tmux_wrap_cmd(cmd_str, tmux_name)
+        # Explicit sh -c argv: tmux execs the shell directly instead of
+        # re-parsing the command line through the user's login shell
         subprocess.run([
             "tmux", "new-session", "-d", "-s", tmux_name,
-            "-x", "200", "-y", "50", full_cmd,
+            "-x", "200", "-y", "50", "sh", "-c", full_cmd,
         ])
         self._tmux_attach(tmux_name, s.id)
         # Auto-kill expert sessions on detach so env vars don't persist
@@ -3845,12 +4737,14 @@ class CCSApp(App):
     def _tmux_attach(self, tmux_name, session_id=None):
         try:
             with self.suspend():
-                os.system(f"tmux attach-session -t {shlex.quote(tmux_name)}")
+                subprocess.run(["tmux", "attach-session", "-t", tmux_name])
         except Exception:
             self._set_status("Cannot suspend in this environment")
             return
         if not session_id:
-            self._do_refresh(force=True)
+            # Plain attach/detach: nothing was deleted, the incremental
+            # scan picks up any messages typed inside tmux from mtimes
+            self._do_refresh()
             return
         is_ephemeral = self.mgr._get_meta(session_id).get("ephemeral", False)
         tmux_alive = subprocess.run(
@@ -3884,6 +4778,10 @@ class CCSApp(App):
                     pass
             self.mgr._delete_meta(session_id)
             self._set_status("Empty session deleted")
+        else:
+            # Session kept and nothing deleted — the cached scan is enough
+            self._do_refresh()
+            return
         self._do_refresh(force=True)
 
     def _cleanup_session_metadata(self, sid):
@@ -3904,7 +4802,7 @@ class CCSApp(App):
             [
                 "tmux", "new-session", "-d", "-s", tmux_name,
                 "-x", "200", "-y", "50",
-                full_cmd,
+                "sh", "-c", full_cmd,
             ]
         )
         self._tmux_attach(tmux_name, uid)
@@ -3922,26 +4820,33 @@ class CCSApp(App):
             [
                 "tmux", "new-session", "-d", "-s", tmux_name,
                 "-x", "200", "-y", "50",
-                full_cmd,
+                "sh", "-c", full_cmd,
             ]
         )
         self._tmux_attach(tmux_name, uid)
 
-    def _active_profile_args(self):
+    def _active_launch(self):
+        """(extra_args, use_tmux) for the active profile.
+
+        Derived values are cached against the loaded profile list and the
+        active name, so launch keys don't rebuild the argument list."""
         profiles = self.mgr.load_profiles()
-        active = next(
-            (p for p in profiles if p.get("name") == self.active_profile_name),
-            None,
-        )
-        return build_args_from_profile(active) if active else []
+        if (profiles is self._launch_src
+                and self.active_profile_name == self._launch_name):
+            return self._launch_val
+        active = self.mgr.profiles_by_name().get(self.active_profile_name)
+        extra = build_args_from_profile(active) if active else []
+        use_tmux = active.get("tmux", True) if active else True
+        self._launch_src = profiles
+        self._launch_name = self.active_profile_name
+        self._launch_val = (extra, use_tmux)
+        return self._launch_val
+
+    def _active_profile_args(self):
+        return self._active_launch()[0]
 
     def _get_use_tmux(self):
-        profiles = self.mgr.load_profiles()
-        active = next(
-            (p for p in profiles if p.get("name") == self.active_profile_name),
-            None,
-        )
-        return active.get("tmux", True) if active else True
+        return self._active_launch()[1]
 
     # -- View switching ----------------------------------------------------
 
@@ -3973,10 +4878,18 @@ class CCSApp(App):
         self, event: OptionList.OptionHighlighted
     ):
         if event.option_list.id == "session-list":
-            self._update_preview()
             self._update_footer()
-            if self.view == "detail":
-                self._update_detail()
+            # Debounce the pane updates: under key-repeat scrolling each
+            # keystroke restarts the timer, so N moves cost one render
+            if self._preview_timer is not None:
+                self._preview_timer.stop()
+            self._preview_timer = self.set_timer(0.05, self._flush_preview_update)
+
+    def _flush_preview_update(self):
+        self._preview_timer = None
+        self._update_preview()
+        if self.view == "detail":
+            self._update_detail()
 
     def on_option_list_option_selected(
         self, event: OptionList.OptionSelected
@@ -4171,36 +5084,7 @@ class CCSApp(App):
             ])
 
         def on_result(action):
-            actions = {
-                "launch": self.action_launch,
-                "tmux_expert": self._action_tmux_expert,
-                "back": self._switch_to_sessions,
-                "switch_pane": self.action_switch_pane,
-                "view": self._switch_to_detail,
-                "new": self.action_new_session,
-                "ephemeral": self.action_ephemeral_session,
-                "mark": self.action_mark,
-                "unmark": self.action_unmark_all,
-                "pin": self.action_toggle_pin,
-                "tag": self.action_set_tag,
-                "remove_tag": self.action_remove_tag,
-                "delete": self.action_delete_session,
-                "delete_empty": self.action_delete_empty,
-                "toggle_cont": self.action_toggle_continuations,
-                "archive_cont": self.action_archive_continuations,
-                "kill_tmux": self.action_kill_tmux,
-                "kill_all_tmux": self.action_kill_all_tmux,
-                "send_input": self.action_send_input,
-                "sort": self.action_cycle_sort,
-                "search": self.action_search,
-                "refresh": self.action_refresh,
-                "rescan": self.action_rescan,
-                "theme": self.action_cycle_theme,
-                "profiles": self.action_profiles,
-                "help": self.action_help,
-                "exit": self.action_quit_confirm,
-            }
-            fn = actions.get(action)
+            fn = self._menu_actions.get(action)
             if fn:
                 fn()
 
@@ -4216,32 +5100,12 @@ class CCSApp(App):
         key = event.key
         event.stop()
         event.prevent_default()
-        sl = self.query_one("#session-list", SessionListWidget)
+        sl = self._w_list
 
         # ── Global keys ──────────────────────────────────────────
-        if key == "ctrl+c":
-            self.action_quit_confirm()
-            return
-        if key in ("question_mark", "?"):
-            self.action_help()
-            return
-        if key == "P":
-            self.action_profiles()
-            return
-        if key == "H":
-            self.action_cycle_theme()
-            return
-        if key == "m":
-            self._show_action_menu()
-            return
-        if key in ("r", "f5"):
-            self.action_refresh()
-            return
-        if key == "S":
-            self.action_rescan()
-            return
-        if key == "escape":
-            self.action_escape_action()
+        fn = self._keys_global.get(key)
+        if fn:
+            fn()
             return
 
         # ── View switching ───────────────────────────────────────
@@ -4259,37 +5123,24 @@ class CCSApp(App):
 
         # ── Detail view keys ─────────────────────────────────────
         if self.view == "detail":
-            if key == "tab":
-                self.action_switch_pane()
-            elif key == "enter":
-                self.action_launch()
-            elif key == "p":
-                self.action_toggle_pin()
-            elif key == "t":
-                self.action_set_tag()
-            elif key == "T":
-                self.action_remove_tag()
-            elif key == "d":
-                self.action_delete_session()
-            elif key == "k":
-                self.action_kill_tmux()
-            elif key == "i":
-                self.action_send_input()
-            elif key == "up":
-                self.query_one("#info-scroll" if self.detail_focus == "info" else "#tmux-pane").scroll_up()
-            elif key == "down":
-                self.query_one("#info-scroll" if self.detail_focus == "info" else "#tmux-pane").scroll_down()
-            elif key == "pageup":
-                self.query_one("#info-scroll" if self.detail_focus == "info" else "#tmux-pane").scroll_page_up()
-            elif key == "pagedown":
-                self.query_one("#info-scroll" if self.detail_focus == "info" else "#tmux-pane").scroll_page_down()
-            elif key == "g":
-                self.query_one("#info-scroll" if self.detail_focus == "info" else "#tmux-pane").scroll_home()
-            elif key == "G":
-                self.query_one("#info-scroll" if self.detail_focus == "info" else "#tmux-pane").scroll_end()
+            fn = self._keys_detail.get(key)
+            if fn:
+                fn()
+                return
+            scroll = _SCROLL_METHODS.get(key)
+            if scroll:
+                pane = self.query_one(
+                    "#info-scroll" if self.detail_focus == "info" else "#tmux-pane"
+                )
+                getattr(pane, scroll)()
             return
 
         # ── Sessions view keys ───────────────────────────────────
+        fn = self._keys_sessions.get(key)
+        if fn:
+            fn()
+            return
+        # Navigation needs the list state, so it stays inline
         if key == "up":
             if sl.highlighted is not None and sl.highlighted > 0:
                 sl.highlighted -= 1
@@ -4308,38 +5159,6 @@ class CCSApp(App):
         elif key == "pagedown":
             if sl.highlighted is not None:
                 sl.highlighted = min(sl.option_count - 1, sl.highlighted + 20)
-        elif key == "enter":
-            self.action_launch()
-        elif key == "space":
-            self.action_mark()
-        elif key == "u":
-            self.action_unmark_all()
-        elif key == "p":
-            self.action_toggle_pin()
-        elif key == "t":
-            self.action_set_tag()
-        elif key == "T":
-            self.action_remove_tag()
-        elif key == "d":
-            self.action_delete_session()
-        elif key == "D":
-            self.action_delete_empty()
-        elif key == "C":
-            self.action_toggle_continuations()
-        elif key == "k":
-            self.action_kill_tmux()
-        elif key == "K":
-            self.action_kill_all_tmux()
-        elif key == "n":
-            self.action_new_session()
-        elif key == "e":
-            self.action_ephemeral_session()
-        elif key == "s":
-            self.action_cycle_sort()
-        elif key == "i":
-            self.action_send_input()
-        elif key == "slash":
-            self.action_search()
 
     # -- Actions -----------------------------------------------------------
 
@@ -4369,10 +5188,7 @@ class CCSApp(App):
                 self._open_profile_editor(None)
             elif result.startswith("edit:"):
                 name = result[5:]
-                profiles = self.mgr.load_profiles()
-                prof = next(
-                    (p for p in profiles if p.get("name") == name), None
-                )
+                prof = self.mgr.profiles_by_name().get(name)
                 if prof:
                     self._open_profile_editor(prof)
             elif result.startswith("delete:"):
@@ -4444,11 +5260,7 @@ class CCSApp(App):
             if text and text.strip() == "SCAN":
                 prev_count = len(self.sessions)
                 prev_ids = {s.id for s in self.sessions}
-                self.mgr._scan_cache = None
-                try:
-                    os.remove(CACHE_FILE)
-                except OSError:
-                    pass
+                self.mgr.clear_scan_cache()
                 self._git_cache.clear()
                 self._do_refresh(force=True)
                 new_count = len(self.sessions)
@@ -4606,19 +5418,23 @@ class CCSApp(App):
     def action_toggle_pin(self):
         if self.view == "sessions" and self.marked:
             for sid in self.marked:
-                self.mgr.toggle_pin(sid)
+                pinned = self.mgr.toggle_pin(sid)
+                cached = self._sessions_by_id.get(sid)
+                if cached:
+                    cached.pinned = pinned
             self._set_status(
                 f"Toggled pin for {len(self.marked)} session(s)"
             )
             self.marked.clear()
-            self._do_refresh()
+            self._refresh_in_place()
             return
         s = self._current_session()
         if s:
             pinned = self.mgr.toggle_pin(s.id)
+            s.pinned = pinned
             icon = "\u2605 Pinned" if pinned else "Unpinned"
             self._set_status(f"{icon}: {s.tag or s.id[:12]}")
-            self._do_refresh()
+            self._refresh_in_place()
 
     def action_set_tag(self):
         s = self._current_session()
@@ -4628,8 +5444,10 @@ class CCSApp(App):
         def on_result(tag):
             if tag:
                 self.mgr.set_tag(s.id, tag)
+                s.tag = tag[:24]
+                s.build_search_blob()
                 self._set_status(f"Tagged: [{tag[:10]}]")
-                self._do_refresh()
+                self._refresh_in_place()
 
         self.push_screen(
             SimpleInputModal("Set Tag", s.tag or "", "Enter tag name (max 24 chars)", max_length=24),
@@ -4642,8 +5460,10 @@ class CCSApp(App):
             return
         if s.tag:
             self.mgr.remove_tag(s.id)
+            s.tag = ""
+            s.build_search_blob()
             self._set_status(f"Removed tag from: {s.id[:12]}")
-            self._do_refresh()
+            self._refresh_in_place()
         else:
             self._set_status("No tag to remove")
 
@@ -4931,21 +5751,9 @@ class CCSApp(App):
     def action_cycle_sort(self):
         if self.view != "sessions":
             return
-        modes = ["date", "name", "project", "tag", "messages", "tmux"]
-        idx = (
-            modes.index(self.sort_mode) if self.sort_mode in modes else 0
-        )
-        self.sort_mode = modes[(idx + 1) % len(modes)]
+        self.sort_mode = _SORT_NEXT.get(self.sort_mode, "date")
         self._do_refresh()
-        labels = {
-            "date": "Date",
-            "name": "Name",
-            "project": "Project",
-            "tag": "Tag",
-            "messages": "Messages",
-            "tmux": "Tmux",
-        }
-        self._set_status(f"Sort: {labels[self.sort_mode]}")
+        self._set_status(f"Sort: {_SORT_LABELS[self.sort_mode]}")
 
     def action_send_input(self):
         if self.view != "detail":
@@ -4993,30 +5801,33 @@ class CCSApp(App):
 
 def _find_session(mgr: SessionManager, query: str) -> Session:
     """Resolve a session by exact tag or ID prefix. Exits on ambiguity."""
-    sessions = mgr.scan()
+    mgr.scan()  # (re)builds the tag and id indexes
     # Exact tag match
-    by_tag = [s for s in sessions if s.tag and s.tag == query]
+    by_tag = mgr._by_tag.get(query, [])
     if len(by_tag) == 1:
         return by_tag[0]
     if len(by_tag) > 1:
-        print(f"\033[31mAmbiguous tag '{query}' — matches {len(by_tag)} sessions\033[0m")
+        print(f"{RED}Ambiguous tag '{query}' — matches {len(by_tag)} sessions{RESET}")
         sys.exit(1)
-    # ID prefix match
-    by_id = [s for s in sessions if s.id.startswith(query)]
-    if len(by_id) == 1:
-        return by_id[0]
-    if len(by_id) > 1:
-        print(f"\033[31mAmbiguous ID prefix '{query}' — matches {len(by_id)} sessions\033[0m")
+    # ID prefix match via bisect on the sorted id list
+    ids = mgr._ids_sorted
+    lo = bisect.bisect_left(ids, (query,))
+    hi = lo
+    while hi < len(ids) and ids[hi][0].startswith(query):
+        hi += 1
+    if hi - lo == 1:
+        return ids[lo][1]
+    if hi - lo > 1:
+        print(f"{RED}Ambiguous ID prefix '{query}' — matches {hi - lo} sessions{RESET}")
         sys.exit(1)
-    print(f"\033[31mNo session found matching '{query}'\033[0m")
+    print(f"{RED}No session found matching '{query}'{RESET}")
     sys.exit(1)
 
 
 def _get_profile_extra(mgr: SessionManager, profile_name: Optional[str] = None) -> List[str]:
     """Get CLI args from a profile (active by default)."""
-    profiles = mgr.load_profiles()
     name = profile_name or mgr.load_active_profile_name()
-    prof = next((p for p in profiles if p.get("name") == name), None)
+    prof = mgr.profiles_by_name().get(name)
     if prof:
         return build_args_from_profile(prof)
     return []
@@ -5026,9 +5837,9 @@ def _get_profile_extra(mgr: SessionManager, profile_name: Optional[str] = None)
 
 
 def cmd_help():
-    print("""\033[1;36m◆ ccs — Claude Code Session Manager\033[0m
+    print(f"""{CYAN}◆ ccs — Claude Code Session Manager{RESET}
 
-\033[1mUsage:\033[0m
+{BOLD}Usage:{RESET}
   ccs                                    Interactive TUI
   ccs list                               List all sessions
   ccs scan [-n|--dry-run]                Rescan all Claude sessions
@@ -5059,7 +5870,7 @@ def cmd_help():
   ccs tmux kill --all                    Kill all tmux sessions
   ccs help                               Show this help
 
-\033[1mProfile creation flags:\033[0m
+{BOLD}Profile creation flags:{RESET}
   --model <model>                        Model name
   --permission-mode <mode>               Permission mode
   --verbose                              Verbose flag
@@ -5072,7 +5883,7 @@ def cmd_help():
   --tools <tools>                        Tools
   --mcp-config <path>                    MCP config path
 
-\033[2mPress ? in the TUI for keybindings help.\033[0m""")
+{DIM}Press ? in the TUI for keybindings help.{RESET}""")
 
 
 def cmd_scan(mgr: SessionManager, dry_run: bool = False):
@@ -5080,8 +5891,8 @@ def cmd_scan(mgr: SessionManager, dry_run: bool = False):
     if dry_run:
         cmd_scan_dry_run(mgr)
         return
-    print("\033[33mThis will clear all caches and re-read every session file.\033[0m")
-    print("\033[33mEmpty sessions will be deleted.\033[0m")
+    print(f"{YELLOW}This will clear all caches and re-read every session file.{RESET}")
+    print(f"{YELLOW}Empty sessions will be deleted.{RESET}")
     print("Type SCAN to confirm: ", end="", flush=True)
     try:
         answer = input().strip()
@@ -5090,13 +5901,9 @@ def cmd_scan(mgr: SessionManager, dry_run: bool = False):
     if answer != "SCAN":
         print("Cancelled.")
         return
-    mgr._scan_cache = None
-    try:
-        os.remove(CACHE_FILE)
-    except OSError:
-        pass
+    mgr.clear_scan_cache()
     sessions = mgr.scan(force=True)
-    print(f"\033[1;36m◆\033[0m Rescan complete: {len(sessions)} session{'s' if len(sessions) != 1 else ''} found")
+    print(f"{CYAN}◆{RESET} Rescan complete: {len(sessions)} session{'s' if len(sessions) != 1 else ''} found")
 
 
 def cmd_scan_dry_run(mgr: SessionManager):
@@ -5149,23 +5956,23 @@ def cmd_scan_dry_run(mgr: SessionManager):
 
     orphaned_meta = [sid for sid in meta if sid not in seen_sids]
 
-    print(f"\033[1;36m◆\033[0m Dry run — no changes made\n")
-    print(f"  \033[1;32mKeep:\033[0m {len(keep)} sessions")
+    print(f"{CYAN}◆{RESET} Dry run — no changes made\n")
+    print(f"  {BOLD_GREEN}Keep:{RESET} {len(keep)} sessions")
     for sid, pdisp, label, mc in keep:
         print(f"    {sid[:12]}  {pdisp[:30]:<30s}  {mc:>4d}m  {label[:40]}")
 
     if delete_empty:
-        print(f"\n  \033[1;31mDelete (empty):\033[0m {len(delete_empty)} sessions")
+        print(f"\n  {BOLD_RED}Delete (empty):{RESET} {len(delete_empty)} sessions")
         for sid, pdisp, label in delete_empty:
             print(f"    {sid[:12]}  {pdisp[:30]:<30s}  {label[:40]}")
 
     if delete_missing_proj:
-        print(f"\n  \033[1;31mDelete (missing project dir):\033[0m {len(delete_missing_proj)} sessions")
+        print(f"\n  {BOLD_RED}Delete (missing project dir):{RESET} {len(delete_missing_proj)} sessions")
         for sid, pdisp, label in delete_missing_proj:
             print(f"    {sid[:12]}  {pdisp[:30]:<30s}  {label[:40]}")
 
     if orphaned_meta:
-        print(f"\n  \033[1;33mOrphaned metadata:\033[0m {len(orphaned_meta)} entries")
+        print(f"\n  {BOLD_YELLOW}Orphaned metadata:{RESET} {len(orphaned_meta)} entries")
         for sid in orphaned_meta:
             tag = meta[sid].get("tag", "")
             print(f"    {sid[:12]}  {tag or '-'}")
@@ -5186,7 +5993,7 @@ def cmd_list(mgr: SessionManager):
             if tw > max_tag_w:
                 max_tag_w = tw
     tag_hdr = f"{'Tag':<{max_tag_w}}" if max_tag_w else ""
-    print(f"  \033[2m  {tag_hdr}{'Modified':<18s}{'ID':<14s}{'Project':<24s}  Description\033[0m")
+    print(f"  {DIM}  {tag_hdr}{'Modified':<18s}{'ID':<14s}{'Project':<24s}  Description{RESET}")
     for s in sessions:
         pin = "★ " if s.pinned else "  "
         tag = f"[{s.tag}]" if s.tag else ""
@@ -5203,7 +6010,7 @@ def cmd_resume(mgr: SessionManager, query: str, profile_name: Optional[str],
     else:
         extra = _get_profile_extra(mgr, profile_name)
     opts = f" {' '.join(extra)}" if extra else ""
-    print(f"\033[1;36m◆\033[0m Resuming session \033[2m({s.id[:8]}…)\033[0m{opts}")
+    print(f"{CYAN}◆{RESET} Resuming session {DIM}({s.id[:8]}…){RESET}{opts}")
     proj_dir = os.path.expanduser(s.project_display) if s.project_display else ""
     if proj_dir and os.path.isdir(proj_dir):
         os.chdir(proj_dir)
@@ -5214,10 +6021,9 @@ def cmd_resume(mgr: SessionManager, query: str, profile_name: Optional[str],
 def cmd_new(mgr: SessionManager, name: str, extra: List[str], ephemeral: bool = False):
     uid = str(uuid_mod.uuid4())
     if ephemeral:
-        mgr._set_meta(uid, ephemeral=True)
-        if name:
-            mgr._set_meta(uid, tag=name, ephemeral=True)
-        print(f"\033[1;36m◆\033[0m Starting ephemeral session \033[2m({uid[:8]}…)\033[0m")
+        # One metadata write covers both the flag and the optional tag
+        mgr._set_meta(uid, tag=name or None, ephemeral=True)
+        print(f"{CYAN}◆{RESET} Starting ephemeral session {DIM}({uid[:8]}…){RESET}")
         cmd = ["claude", "--session-id", uid] + extra
         try:
             subprocess.run(cmd)
@@ -5227,8 +6033,8 @@ def cmd_new(mgr: SessionManager, name: str, extra: List[str], ephemeral: bool =
             mgr.purge_ephemeral()
     else:
         mgr._set_meta(uid, tag=name)
-        print(f"\033[1;36m◆\033[0m Starting named session: "
-              f"\033[1;32m{name}\033[0m \033[2m({uid[:8]}…)\033[0m")
+        print(f"{CYAN}◆{RESET} Starting named session: "
+              f"{BOLD_GREEN}{name}{RESET} {DIM}({uid[:8]}…){RESET}")
         cmd = ["claude", "--session-id", uid] + extra
         os.execvp("claude", cmd)
 
@@ -5261,7 +6067,7 @@ def cmd_tag_rename(mgr: SessionManager, old_tag: str, new_tag: str):
     meta = mgr._load_meta()
     matches = [sid for sid, m in meta.items() if m.get("tag") == old_tag]
     if not matches:
-        print(f"\033[31mNo session with tag '{old_tag}'\033[0m")
+        print(f"{RED}No session with tag '{old_tag}'{RESET}")
         sys.exit(1)
     for sid in matches:
         mgr.set_tag(sid, new_tag)
@@ -5290,8 +6096,8 @@ def _cli_kill_tmux(sid):
 def cmd_delete_session(mgr: SessionManager, query: str):
     s = _find_session(mgr, query)
     label = s.tag or s.label[:40] or s.id[:12]
-    print(f"\033[1;31mDelete '{label}'?\033[0m")
-    print("\033[33mWARNING: This permanently deletes the Claude session data and cannot be recovered.\033[0m")
+    print(f"{BOLD_RED}Delete '{label}'?{RESET}")
+    print(f"{YELLOW}WARNING: This permanently deletes the Claude session data and cannot be recovered.{RESET}")
     print("Type DELETE to confirm: ", end="", flush=True)
     try:
         answer = input().strip()
@@ -5328,14 +6134,9 @@ def cmd_delete_empty(mgr: SessionManager):
 
 def cmd_search(mgr: SessionManager, query: str):
     sessions = mgr.scan()
+    # search_blob is the same four fields, lowercased once at scan time
     q = query.lower()
-    matches = [
-        s for s in sessions
-        if q in s.label.lower()
-        or q in s.project_display.lower()
-        or q in s.tag.lower()
-        or q in s.id.lower()
-    ]
+    matches = [s for s in sessions if q in s.search_blob]
     if not matches:
         print(f"No sessions matching '{query}'.")
         return
@@ -5347,7 +6148,7 @@ def cmd_search(mgr: SessionManager, query: str):
             if tw > max_tag_w:
                 max_tag_w = tw
     tag_hdr = f"{'Tag':<{max_tag_w}}" if max_tag_w else ""
-    print(f"  \033[2m  {tag_hdr}{'Modified':<18s}{'ID':<14s}{'Project':<24s}  Description\033[0m")
+    print(f"  {DIM}  {tag_hdr}{'Modified':<18s}{'ID':<14s}{'Project':<24s}  Description{RESET}")
     for s in matches:
         pin = "★ " if s.pinned else "  "
         tag = f"[{s.tag}]" if s.tag else ""
@@ -5370,14 +6171,29 @@ def cmd_profile_list(mgr: SessionManager):
 
 
 def cmd_profile_set(mgr: SessionManager, name: str):
-    profiles = mgr.load_profiles()
-    if not any(p.get("name") == name for p in profiles):
-        print(f"\033[31mProfile '{name}' not found.\033[0m")
+    if name not in mgr.profiles_by_name():
+        print(f"{RED}Profile '{name}' not found.{RESET}")
         sys.exit(1)
     mgr.save_active_profile_name(name)
     print(f"Active profile: {name}")
 
 
+# Boolean claude flags cmd_profile_new accepts verbatim
+_BOOL_FLAGS = frozenset((
+    "--verbose", "--dangerously-skip-permissions",
+    "--print", "--continue", "--no-session-persistence",
+))
+
+# Value-taking profile flags → profile dict key, for cmd_profile_new
+_PROFILE_VALUE_FLAGS = {
+    "--model": "model",
+    "--permission-mode": "permission_mode",
+    "--system-prompt": "system_prompt",
+    "--tools": "tools",
+    "--mcp-config": "mcp_config",
+}
+
+
 def cmd_profile_new(mgr: SessionManager, name: str, cli_args: List[str]):
     """Create a profile from CLI flags."""
     profile = {
@@ -5386,29 +6202,18 @@ def cmd_profile_new(mgr: SessionManager, name: str, cli_args: List[str]):
         "mcp_config": "", "custom_args": "", "tmux": True,
     }
     i = 0
+    n = len(cli_args)
     flags_list = []
-    while i < len(cli_args):
+    while i < n:
         a = cli_args[i]
-        if a == "--model" and i + 1 < len(cli_args):
-            profile["model"] = cli_args[i + 1]
-            i += 2
-        elif a == "--permission-mode" and i + 1 < len(cli_args):
-            profile["permission_mode"] = cli_args[i + 1]
-            i += 2
-        elif a == "--system-prompt" and i + 1 < len(cli_args):
-            profile["system_prompt"] = cli_args[i + 1]
-            i += 2
-        elif a == "--tools" and i + 1 < len(cli_args):
-            profile["tools"] = cli_args[i + 1]
-            i += 2
-        elif a == "--mcp-config" and i + 1 < len(cli_args):
-            profile["mcp_config"] = cli_args[i + 1]
+        key = _PROFILE_VALUE_FLAGS.get(a)
+        if key is not None and i + 1 < n:
+            profile[key] = cli_args[i + 1]
             i += 2
         elif a == "--no-tmux":
             profile["tmux"] = False
             i += 1
-        elif a in ("--verbose", "--dangerously-skip-permissions",
-                    "--print", "--continue", "--no-session-persistence"):
+        elif a in _BOOL_FLAGS:
             flags_list.append(a)
             i += 1
         else:
@@ -5421,14 +6226,13 @@ def cmd_profile_new(mgr: SessionManager, name: str, cli_args: List[str]):
 
 
 def cmd_profile_info(mgr: SessionManager, name: str):
-    profiles = mgr.load_profiles()
-    profile = next((p for p in profiles if p.get("name") == name), None)
+    profile = mgr.profiles_by_name().get(name)
     if not profile:
-        print(f"\033[31mProfile '{name}' not found.\033[0m")
+        print(f"{RED}Profile '{name}' not found.{RESET}")
         sys.exit(1)
     active = mgr.load_active_profile_name()
     active_str = " (active)" if name == active else ""
-    print(f"\033[1;36m◆\033[0m Profile: \033[1m{name}\033[0m{active_str}")
+    print(f"{CYAN}◆{RESET} Profile: {BOLD}{name}{RESET}{active_str}")
     print(f"  Mode:            {'tmux' if profile.get('tmux', True) else 'terminal'}")
     model = profile.get("model", "") or "default"
     for display_name, mid in MODELS:
@@ -5459,16 +6263,15 @@ def cmd_profile_info(mgr: SessionManager, name: str):
         print(f"  Expert args:     {expert}")
     args = build_args_from_profile(profile)
     if args:
-        print(f"  \033[2mCLI: claude {' '.join(args)}\033[0m")
+        print(f"  {DIM}CLI: claude {' '.join(args)}{RESET}")
 
 
 def cmd_profile_delete(mgr: SessionManager, name: str):
     if name.lower() == "default":
-        print("\033[31mCannot delete the default profile.\033[0m")
+        print(f"{RED}Cannot delete the default profile.{RESET}")
         sys.exit(1)
-    profiles = mgr.load_profiles()
-    if not any(p.get("name") == name for p in profiles):
-        print(f"\033[31mProfile '{name}' not found.\033[0m")
+    if name not in mgr.profiles_by_name():
+        print(f"{RED}Profile '{name}' not found.{RESET}")
         sys.exit(1)
     mgr.delete_profile(name)
     # Revert active if deleted
@@ -5486,7 +6289,7 @@ def cmd_theme_list(mgr: SessionManager):
 
 def cmd_theme_set(mgr: SessionManager, name: str):
     if name not in THEME_NAMES:
-        print(f"\033[31mUnknown theme '{name}'. Available: {', '.join(THEME_NAMES)}\033[0m")
+        print(f"{RED}Unknown theme '{name}'. Available: {', '.join(THEME_NAMES)}{RESET}")
         sys.exit(1)
     mgr.save_theme(name)
     print(f"Theme set to: {name}")
@@ -5496,7 +6299,7 @@ def cmd_info(mgr: SessionManager, query: str):
     s = _find_session(mgr, query)
     ts = datetime.datetime.fromtimestamp(s.mtime).strftime("%Y-%m-%d %H:%M")
     pinned_str = " (pinned)" if s.pinned else ""
-    print(f"\033[1;36m◆\033[0m Session: \033[1m{s.id}\033[0m{pinned_str}")
+    print(f"{CYAN}◆{RESET} Session: {BOLD}{s.id}{RESET}{pinned_str}")
     if s.tag:
         print(f"  Tag:             {s.tag}")
     print(f"  Project:         {s.project_display}")
@@ -5514,34 +6317,44 @@ def cmd_info(mgr: SessionManager, query: str):
 def cmd_export(mgr: SessionManager, query: str):
     s = _find_session(mgr, query)
     ts = datetime.datetime.fromtimestamp(s.mtime).strftime("%Y-%m-%d %H:%M")
-    print(f"# Session: {s.label}")
-    print(f"- **ID:** `{s.id}`")
+    # Accumulate and write once — per-message print() locks and flushes
+    # stdout for every line, which dominates on long sessions
+    out = [f"# Session: {s.label}", f"- **ID:** `{s.id}`"]
     if s.tag:
-        print(f"- **Tag:** {s.tag}")
-    print(f"- **Project:** {s.project_display}")
-    print(f"- **Modified:** {ts}")
+        out.append(f"- **Tag:** {s.tag}")
+    out.append(f"- **Project:** {s.project_display}")
+    out.append(f"- **Modified:** {ts}")
     if s.pinned:
-        print("- **Pinned:** yes")
-    print(f"- **Messages:** {s.msg_count}")
-    print()
+        out.append("- **Pinned:** yes")
+    out.append(f"- **Messages:** {s.msg_count}")
+    out.append("")
     try:
-        with open(s.path, "r", errors="replace") as f:
+        with open(s.path, "rb") as f:
             for ln in f:
                 try:
-                    d = json.loads(ln)
+                    d = _json_loads(ln.decode("utf-8", errors="replace"))
                 except Exception:
                     continue
                 msg_type = d.get("type")
                 if msg_type == "user":
                     txt = SessionManager._extract_text(d.get("message", {}))
                     if txt:
-                        print(f"## User\n\n{txt}\n")
+                        out.append(f"## User\n\n{txt}\n")
                 elif msg_type == "assistant":
                     txt = SessionManager._extract_text(d.get("message", {}))
                     if txt:
-                        print(f"## Assistant\n\n{txt}\n")
+                        out.append(f"## Assistant\n\n{txt}\n")
     except Exception as e:
-        print(f"\n*Error reading session file: {e}*")
+        out.append(f"\n*Error reading session file: {e}*")
+    out.append("")
+    sys.stdout.write("\n".join(out))
+
+
+def _require_tmux():
+    """Exit with the standard error if tmux isn't installed."""
+    if not HAS_TMUX:
+        print(f"{RED}tmux is not installed.{RESET}")
+        sys.exit(1)
 
 
 def _list_ccs_tmux_names():
@@ -5575,258 +6388,310 @@ def cmd_tmux_list(mgr: SessionManager):
 
 
 def cmd_tmux_attach(mgr: SessionManager, name: str):
-    if not HAS_TMUX:
-        print("\033[31mtmux is not installed.\033[0m")
-        sys.exit(1)
+    _require_tmux()
     rc = subprocess.run(["tmux", "has-session", "-t", name], capture_output=True).returncode
     if rc != 0:
-        print(f"\033[31mNo tmux session named '{name}'.\033[0m")
+        print(f"{RED}No tmux session named '{name}'.{RESET}")
         sys.exit(1)
     os.execvp("tmux", ["tmux", "attach-session", "-t", name])
 
 
 def cmd_tmux_kill(mgr: SessionManager, name: str):
-    if not HAS_TMUX:
-        print("\033[31mtmux is not installed.\033[0m")
-        sys.exit(1)
+    _require_tmux()
     rc = subprocess.run(["tmux", "has-session", "-t", name], capture_output=True).returncode
     if rc != 0:
-        print(f"\033[31mNo tmux session named '{name}'.\033[0m")
+        print(f"{RED}No tmux session named '{name}'.{RESET}")
         sys.exit(1)
     subprocess.run(["tmux", "kill-session", "-t", name], capture_output=True)
     print(f"Killed tmux session: {name}")
 
 
 def cmd_tmux_kill_all(mgr: SessionManager):
-    if not HAS_TMUX:
-        print("\033[31mtmux is not installed.\033[0m")
-        sys.exit(1)
+    _require_tmux()
     names = _list_ccs_tmux_names()
     if not names:
         print("No active ccs tmux sessions to kill.")
         return
+    # One tmux invocation with ';'-chained commands instead of a
+    # fork+exec per session
+    cmd = ["tmux"]
     for name in names:
-        subprocess.run(["tmux", "kill-session", "-t", name], capture_output=True)
+        cmd += ["kill-session", "-t", name, ";"]
+    r = subprocess.run(cmd[:-1], capture_output=True)
+    if r.returncode != 0:
+        # Chained form rejected (old tmux) — fall back to one per session
+        for name in names:
+            subprocess.run(["tmux", "kill-session", "-t", name], capture_output=True)
     print(f"Killed {len(names)} tmux session{'s' if len(names) != 1 else ''}.")
 
 
 # ── Main ─────────────────────────────────────────────────────────────
 
 
-def main():
-    args = sys.argv[1:]
+# ── CLI verb dispatch ────────────────────────────────────────────────
 
-    mgr = SessionManager()
-    mgr.purge_ephemeral()
-    mgr.scan(force=True)  # clean up empty sessions on startup
 
-    if not args:
-        # Launch Textual TUI
-        app = CCSApp()
-        app.run()
-        action = app.exit_action
-        if action is None:
-            return
+def _verb_help(mgr, rest):
+    cmd_help()
 
-        if action[0] == "resume":
-            _, sid, extra, proj_dir = action
-            cmd = ["claude", "--resume", sid] + extra
-            opts = f" {' '.join(extra)}" if extra else ""
-            print(f"\033[1;36m◆\033[0m Resuming session \033[2m({sid[:8]}…)\033[0m{opts}")
-            if proj_dir and os.path.isdir(proj_dir):
-                os.chdir(proj_dir)
-            os.execvp("claude", cmd)
 
-        elif action[0] == "new":
-            _, name = action
-            cmd_new(mgr, name, [])
+def _verb_list(mgr, rest):
+    cmd_list(mgr)
 
-        elif action[0] == "tmp":
-            cmd_new(mgr, "", [], ephemeral=True)
 
-        return
+def _verb_scan(mgr, rest):
+    dry = "--dry-run" in rest or "-n" in rest
+    cmd_scan(mgr, dry_run=dry)
 
-    verb = args[0]
 
-    if verb in ("help", "-h", "--help"):
-        cmd_help()
+def _verb_resume(mgr, rest):
+    if not rest:
+        print(f"{RED}Usage: ccs resume <id|tag> [-p <profile>] [--claude <opts>]{RESET}")
+        sys.exit(1)
+    query = rest[0]
+    profile_name = None
+    claude_args = None
+    # Each token is consumed exactly once; unknown flags now error
+    # loudly instead of being silently dropped
+    it = iter(rest[1:])
+    for tok in it:
+        if tok == "-p":
+            profile_name = next(it, None)
+            if profile_name is None:
+                print(f"{RED}Usage: ccs resume <id|tag> [-p <profile>] [--claude <opts>]{RESET}")
+                sys.exit(1)
+        elif tok == "--claude":
+            claude_args = list(it)
+            break
+        else:
+            print(f"{RED}Unknown flag: {tok}{RESET}")
+            sys.exit(1)
+    cmd_resume(mgr, query, profile_name, claude_args)
+
+
+def _verb_new(mgr, rest):
+    ephemeral = False
+    rest = list(rest)
+    if "-e" in rest:
+        ephemeral = True
+        rest.remove("-e")
+    if "--ephemeral" in rest:
+        ephemeral = True
+        rest.remove("--ephemeral")
+    if not rest and not ephemeral:
+        print(f"{RED}Usage: ccs new <name> | ccs new -e [name]{RESET}")
+        sys.exit(1)
+    name = rest[0] if rest else ""
+    cmd_new(mgr, name, rest[1:], ephemeral=ephemeral)
 
-    elif verb == "list":
-        cmd_list(mgr)
 
-    elif verb == "scan":
-        dry = "--dry-run" in args[1:] or "-n" in args[1:]
-        cmd_scan(mgr, dry_run=dry)
+def _verb_pin(mgr, rest):
+    if not rest:
+        print(f"{RED}Usage: ccs pin <id|tag>{RESET}")
+        sys.exit(1)
+    cmd_pin(mgr, rest[0])
 
-    elif verb == "resume":
-        if len(args) < 2:
-            print("\033[31mUsage: ccs resume <id|tag> [-p <profile>] [--claude <opts>]\033[0m")
-            sys.exit(1)
-        query = args[1]
-        profile_name = None
-        claude_args = None
-        i = 2
-        while i < len(args):
-            if args[i] == "-p" and i + 1 < len(args):
-                profile_name = args[i + 1]
-                i += 2
-            elif args[i] == "--claude":
-                claude_args = args[i + 1:]
-                break
-            else:
-                i += 1
-        cmd_resume(mgr, query, profile_name, claude_args)
-
-    elif verb == "new":
-        ephemeral = False
-        rest = args[1:]
-        if "-e" in rest:
-            ephemeral = True
-            rest.remove("-e")
-        if "--ephemeral" in rest:
-            ephemeral = True
-            rest.remove("--ephemeral")
-        if not rest and not ephemeral:
-            print("\033[31mUsage: ccs new <name> | ccs new -e [name]\033[0m")
-            sys.exit(1)
-        name = rest[0] if rest else ""
-        cmd_new(mgr, name, rest[1:], ephemeral=ephemeral)
 
-    elif verb == "pin":
-        if len(args) < 2:
-            print("\033[31mUsage: ccs pin <id|tag>\033[0m")
-            sys.exit(1)
-        cmd_pin(mgr, args[1])
+def _verb_unpin(mgr, rest):
+    if not rest:
+        print(f"{RED}Usage: ccs unpin <id|tag>{RESET}")
+        sys.exit(1)
+    cmd_unpin(mgr, rest[0])
 
-    elif verb == "unpin":
-        if len(args) < 2:
-            print("\033[31mUsage: ccs unpin <id|tag>\033[0m")
-            sys.exit(1)
-        cmd_unpin(mgr, args[1])
 
-    elif verb == "tag":
-        if len(args) >= 2 and args[1] == "rename":
-            if len(args) < 4:
-                print("\033[31mUsage: ccs tag rename <oldtag> <newtag>\033[0m")
-                sys.exit(1)
-            cmd_tag_rename(mgr, args[2], args[3])
-        elif len(args) < 3:
-            print("\033[31mUsage: ccs tag <id|tag> <newtag>  |  ccs tag rename <old> <new>\033[0m")
+def _verb_tag(mgr, rest):
+    if rest and rest[0] == "rename":
+        if len(rest) < 3:
+            print(f"{RED}Usage: ccs tag rename <oldtag> <newtag>{RESET}")
             sys.exit(1)
-        else:
-            cmd_tag(mgr, args[1], args[2])
+        cmd_tag_rename(mgr, rest[1], rest[2])
+    elif len(rest) < 2:
+        print(f"{RED}Usage: ccs tag <id|tag> <newtag>  |  ccs tag rename <old> <new>{RESET}")
+        sys.exit(1)
+    else:
+        cmd_tag(mgr, rest[0], rest[1])
 
-    elif verb == "untag":
-        if len(args) < 2:
-            print("\033[31mUsage: ccs untag <id|tag>\033[0m")
-            sys.exit(1)
-        cmd_untag(mgr, args[1])
 
-    elif verb == "delete":
-        if len(args) >= 2 and args[1] == "--empty":
-            cmd_delete_empty(mgr)
-        elif len(args) >= 2:
-            cmd_delete_session(mgr, args[1])
-        else:
-            print("\033[31mUsage: ccs delete <id|tag> | ccs delete --empty\033[0m")
-            sys.exit(1)
+def _verb_untag(mgr, rest):
+    if not rest:
+        print(f"{RED}Usage: ccs untag <id|tag>{RESET}")
+        sys.exit(1)
+    cmd_untag(mgr, rest[0])
 
-    elif verb == "search":
-        if len(args) < 2:
-            print("\033[31mUsage: ccs search <query>\033[0m")
-            sys.exit(1)
-        cmd_search(mgr, " ".join(args[1:]))
 
-    elif verb == "info":
-        if len(args) < 2:
-            print("\033[31mUsage: ccs info <id|tag>\033[0m")
-            sys.exit(1)
-        cmd_info(mgr, args[1])
+def _verb_delete(mgr, rest):
+    if rest and rest[0] == "--empty":
+        cmd_delete_empty(mgr)
+    elif rest:
+        cmd_delete_session(mgr, rest[0])
+    else:
+        print(f"{RED}Usage: ccs delete <id|tag> | ccs delete --empty{RESET}")
+        sys.exit(1)
 
-    elif verb == "export":
-        if len(args) < 2:
-            print("\033[31mUsage: ccs export <id|tag>\033[0m")
-            sys.exit(1)
-        cmd_export(mgr, args[1])
 
-    elif verb == "profile":
-        if len(args) < 2:
-            print("\033[31mUsage: ccs profile list|info|set|new|delete\033[0m")
+def _verb_search(mgr, rest):
+    if not rest:
+        print(f"{RED}Usage: ccs search <query>{RESET}")
+        sys.exit(1)
+    cmd_search(mgr, " ".join(rest))
+
+
+def _verb_info(mgr, rest):
+    if not rest:
+        print(f"{RED}Usage: ccs info <id|tag>{RESET}")
+        sys.exit(1)
+    cmd_info(mgr, rest[0])
+
+
+def _verb_export(mgr, rest):
+    if not rest:
+        print(f"{RED}Usage: ccs export <id|tag>{RESET}")
+        sys.exit(1)
+    cmd_export(mgr, rest[0])
+
+
+def _verb_profile(mgr, rest):
+    if not rest:
+        print(f"{RED}Usage: ccs profile list|info|set|new|delete{RESET}")
+        sys.exit(1)
+    sub = rest[0]
+    if sub == "list":
+        cmd_profile_list(mgr)
+    elif sub == "info":
+        if len(rest) < 2:
+            print(f"{RED}Usage: ccs profile info <name>{RESET}")
             sys.exit(1)
-        sub = args[1]
-        if sub == "list":
-            cmd_profile_list(mgr)
-        elif sub == "info":
-            if len(args) < 3:
-                print("\033[31mUsage: ccs profile info <name>\033[0m")
-                sys.exit(1)
-            cmd_profile_info(mgr, args[2])
-        elif sub == "set":
-            if len(args) < 3:
-                print("\033[31mUsage: ccs profile set <name>\033[0m")
-                sys.exit(1)
-            cmd_profile_set(mgr, args[2])
-        elif sub == "new":
-            if len(args) < 3:
-                print("\033[31mUsage: ccs profile new <name> [--model ...] [flags]\033[0m")
-                sys.exit(1)
-            cmd_profile_new(mgr, args[2], args[3:])
-        elif sub == "delete":
-            if len(args) < 3:
-                print("\033[31mUsage: ccs profile delete <name>\033[0m")
-                sys.exit(1)
-            cmd_profile_delete(mgr, args[2])
-        else:
-            print(f"\033[31mUnknown profile command: {sub}\033[0m")
+        cmd_profile_info(mgr, rest[1])
+    elif sub == "set":
+        if len(rest) < 2:
+            print(f"{RED}Usage: ccs profile set <name>{RESET}")
             sys.exit(1)
-
-    elif verb == "theme":
-        if len(args) < 2:
-            print("\033[31mUsage: ccs theme list|set\033[0m")
+        cmd_profile_set(mgr, rest[1])
+    elif sub == "new":
+        if len(rest) < 2:
+            print(f"{RED}Usage: ccs profile new <name> [--model ...] [flags]{RESET}")
             sys.exit(1)
-        sub = args[1]
-        if sub == "list":
-            cmd_theme_list(mgr)
-        elif sub == "set":
-            if len(args) < 3:
-                print(f"\033[31mUsage: ccs theme set <{'|'.join(THEME_NAMES)}>\033[0m")
-                sys.exit(1)
-            cmd_theme_set(mgr, args[2])
-        else:
-            print(f"\033[31mUnknown theme command: {sub}\033[0m")
+        cmd_profile_new(mgr, rest[1], rest[2:])
+    elif sub == "delete":
+        if len(rest) < 2:
+            print(f"{RED}Usage: ccs profile delete <name>{RESET}")
             sys.exit(1)
+        cmd_profile_delete(mgr, rest[1])
+    else:
+        print(f"{RED}Unknown profile command: {sub}{RESET}")
+        sys.exit(1)
 
-    elif verb == "tmux":
-        if not HAS_TMUX:
-            print("\033[31mtmux is not installed.\033[0m")
+
+def _verb_theme(mgr, rest):
+    if not rest:
+        print(f"{RED}Usage: ccs theme list|set{RESET}")
+        sys.exit(1)
+    sub = rest[0]
+    if sub == "list":
+        cmd_theme_list(mgr)
+    elif sub == "set":
+        if len(rest) < 2:
+            print(f"{RED}Usage: ccs theme set <{'|'.join(THEME_NAMES)}>{RESET}")
             sys.exit(1)
-        if len(args) < 2:
-            print("\033[31mUsage: ccs tmux list|attach|kill\033[0m")
+        cmd_theme_set(mgr, rest[1])
+    else:
+        print(f"{RED}Unknown theme command: {sub}{RESET}")
+        sys.exit(1)
+
+
+def _verb_tmux(mgr, rest):
+    _require_tmux()
+    if not rest:
+        print(f"{RED}Usage: ccs tmux list|attach|kill{RESET}")
+        sys.exit(1)
+    sub = rest[0]
+    if sub == "list":
+        cmd_tmux_list(mgr)
+    elif sub == "attach":
+        if len(rest) < 2:
+            print(f"{RED}Usage: ccs tmux attach <name>{RESET}")
             sys.exit(1)
-        sub = args[1]
-        if sub == "list":
-            cmd_tmux_list(mgr)
-        elif sub == "attach":
-            if len(args) < 3:
-                print("\033[31mUsage: ccs tmux attach <name>\033[0m")
-                sys.exit(1)
-            cmd_tmux_attach(mgr, args[2])
-        elif sub == "kill":
-            if len(args) >= 3 and args[2] == "--all":
-                cmd_tmux_kill_all(mgr)
-            elif len(args) >= 3:
-                cmd_tmux_kill(mgr, args[2])
-            else:
-                print("\033[31mUsage: ccs tmux kill <name> | ccs tmux kill --all\033[0m")
-                sys.exit(1)
+        cmd_tmux_attach(mgr, rest[1])
+    elif sub == "kill":
+        if len(rest) >= 2 and rest[1] == "--all":
+            cmd_tmux_kill_all(mgr)
+        elif len(rest) >= 2:
+            cmd_tmux_kill(mgr, rest[1])
         else:
-            print(f"\033[31mUnknown tmux command: {sub}\033[0m")
+            print(f"{RED}Usage: ccs tmux kill <name> | ccs tmux kill --all{RESET}")
             sys.exit(1)
-
     else:
-        print(f"\033[31mUnknown command: {verb}\033[0m")
+        print(f"{RED}Unknown tmux command: {sub}{RESET}")
+        sys.exit(1)
+
+
+# Verbs that never read the session list — they skip startup cleanup
+_NO_SESSION_VERBS = frozenset(("help", "-h", "--help",
+                               "profile", "theme", "tmux"))
+
+# Verb → handler, built once at import; help aliases share a handler
+COMMANDS = {
+    "help": _verb_help, "-h": _verb_help, "--help": _verb_help,
+    "list": _verb_list,
+    "scan": _verb_scan,
+    "resume": _verb_resume,
+    "new": _verb_new,
+    "pin": _verb_pin,
+    "unpin": _verb_unpin,
+    "tag": _verb_tag,
+    "untag": _verb_untag,
+    "delete": _verb_delete,
+    "search": _verb_search,
+    "info": _verb_info,
+    "export": _verb_export,
+    "profile": _verb_profile,
+    "theme": _verb_theme,
+    "tmux": _verb_tmux,
+}
+
+
+def main():
+    args = sys.argv[1:]
+
+    mgr = SessionManager()
+    # Startup cleanup (ephemeral purge + forced rescan) re-reads every
+    # session file; only pay for it when the verb reads the session list
+    if not args or args[0] not in _NO_SESSION_VERBS:
+        mgr.purge_ephemeral()
+        mgr.scan(force=True)  # clean up empty sessions on startup
+
+    if not args:
+        # Launch Textual TUI
+        app = CCSApp()
+        app.run()
+        action = app.exit_action
+        if action is None:
+            return
+
+        if action[0] == "resume":
+            _, sid, extra, proj_dir = action
+            cmd = ["claude", "--resume", sid] + extra
+            opts = f" {' '.join(extra)}" if extra else ""
+            print(f"{CYAN}◆{RESET} Resuming session {DIM}({sid[:8]}…){RESET}{opts}")
+            if proj_dir and os.path.isdir(proj_dir):
+                os.chdir(proj_dir)
+            os.execvp("claude", cmd)
+
+        elif action[0] == "new":
+            _, name = action
+            cmd_new(mgr, name, [])
+
+        elif action[0] == "tmp":
+            cmd_new(mgr, "", [], ephemeral=True)
+
+        return
+
+    handler = COMMANDS.get(args[0])
+    if handler is None:
+        print(f"{RED}Unknown command: {args[0]}{RESET}")
         print("Run 'ccs help' for usage information.")
         sys.exit(1)
+    handler(mgr, args[1:])
 
 
 if __name__ == "__main__":